@@ -37,6 +37,8 @@ from sqlalchemy import (
     func,
     or_,
     extract,
+    and_,
+    case,
 )
 
 from config import Config
@@ -538,6 +540,25 @@ def scan_inbox_core():
 
     return moved_txt, converted_pdfs
 
+def _unlink_files(directory, suffix=""):
+    """
+    Delete the regular files directly inside `directory` whose name ends with
+    `suffix`; subdirectories are left alone and errors are ignored.
+
+    os.scandir() yields names with cached file types, so this avoids a Path
+    object and an extra stat() per entry on large upload folders.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.name.endswith(suffix):
+                continue
+            try:
+                if entry.is_file():
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+
 @app.route("/import/ocr", methods=["GET", "POST"])
 def import_ocr():
     from pathlib import Path
@@ -561,19 +582,10 @@ def import_ocr():
         )
 
         # 1) Clear OLD uploads so we only handle the current batch
-        for p in uploads_dir.iterdir():
-            try:
-                if p.is_file():
-                    p.unlink()
-            except OSError:
-                pass
+        _unlink_files(uploads_dir)
 
         # 2) Clear old *_ocr.txt so only new OCR results are processed
-        for p in statements_dir.glob("*.txt"):
-            try:
-                p.unlink()
-            except OSError:
-                pass
+        _unlink_files(statements_dir, suffix=".txt")
 
         saved_any = False
         for f in uploaded_files:
@@ -627,22 +639,35 @@ def api_summary():
     today = date.today()
     month_start = date(today.year, today.month, 1)
 
-    # Load all transactions once (fine for personal scale)
-    all_tx = Transaction.query.all()
-
-    # Current balance = sum of all amounts
-    current_balance = sum((t.amount or 0.0) for t in all_tx)
-
-    # This month only
-    month_tx = [
-        t for t in all_tx
-        if t.date is not None and month_start <= t.date <= today
-    ]
-
-    income_this_month = sum((t.amount or 0.0) for t in month_tx if (t.amount or 0) > 0)
-    spent_this_month = sum((t.amount or 0.0) for t in month_tx if (t.amount or 0) < 0)
+    # Balance and this month's income/spending as one conditional aggregate,
+    # instead of loading the whole table to sum it in Python.
+    in_month = and_(Transaction.date >= month_start, Transaction.date <= today)
+    current_balance, income_this_month, spent_this_month = db.session.query(
+        func.coalesce(func.sum(Transaction.amount), 0.0),
+        func.coalesce(func.sum(case(
+            (and_(in_month, Transaction.amount > 0), Transaction.amount),
+            else_=0.0,
+        )), 0.0),
+        func.coalesce(func.sum(case(
+            (and_(in_month, Transaction.amount < 0), Transaction.amount),
+            else_=0.0,
+        )), 0.0),
+    ).one()
     net_this_month = income_this_month + spent_this_month
 
+    # Rows for the category breakdown (this month) and the 30-day trend.
+    days_back = 30
+    start_date = today - timedelta(days=days_back - 1)
+    window_tx = (
+        db.session.query(Transaction.date, Transaction.amount, Transaction.category)
+        .filter(
+            Transaction.date >= min(month_start, start_date),
+            Transaction.date <= today,
+        )
+        .all()
+    )
+    month_tx = [t for t in window_tx if t.date >= month_start]
+
     # By category (this month)
     by_category_map = {}
     for t in month_tx:
@@ -656,12 +681,7 @@ def api_summary():
     ]
 
     # Trend: last 30 days by date
-    days_back = 30
-    start_date = today - timedelta(days=days_back - 1)
-    recent_tx = [
-        t for t in all_tx
-        if t.date is not None and start_date <= t.date <= today
-    ]
+    recent_tx = [t for t in window_tx if t.date >= start_date]
 
     trend_map = {}  # date -> dict(income=..., spending=..., net=...)
     for t in recent_tx:
@@ -1001,23 +1021,40 @@ def budget_summary():
         (2025, 5), (2025, 6), (2025, 7), (2025, 8), (2025, 9), (2025, 10),
         (2025, 11), (2025, 12), (2026, 1), (2026, 2), (2026, 3), (2026, 4),
     ]
+    # One GROUP BY over the whole window instead of two queries per month;
+    # months with no activity are filled with zeros below.
+    _last_y, _last_m = _chart_months[-1]
+    _cc_end = date(_last_y + _last_m // 12, _last_m % 12 + 1, 1)
+    _cc_year = extract("year", Transaction.date)
+    _cc_month = extract("month", Transaction.date)
+    _cc_rows = (
+        db.session.query(
+            _cc_year,
+            _cc_month,
+            func.sum(Transaction.amount),
+            func.sum(case(
+                (Transaction.merchant.ilike("%interest%"), Transaction.amount),
+                else_=0.0,
+            )),
+        )
+        .filter(
+            Transaction.account_id.in_(_CC_IDS),
+            Transaction.date >= date(*_chart_months[0], 1),
+            Transaction.date < _cc_end,
+        )
+        .group_by(_cc_year, _cc_month)
+        .all()
+    )
+    _cc_by_month = {
+        (int(y), int(m)): (net, interest) for y, m, net, interest in _cc_rows
+    }
     cc_net_history = []
     for _y, _m in _chart_months:
-        _net = db.session.query(func.sum(Transaction.amount)).filter(
-            Transaction.account_id.in_(_CC_IDS),
-            extract("year",  Transaction.date) == _y,
-            extract("month", Transaction.date) == _m,
-        ).scalar() or 0.0
-        _interest = db.session.query(func.sum(Transaction.amount)).filter(
-            Transaction.account_id.in_(_CC_IDS),
-            extract("year",  Transaction.date) == _y,
-            extract("month", Transaction.date) == _m,
-            Transaction.merchant.ilike("%interest%"),
-        ).scalar() or 0.0
+        _net, _interest = _cc_by_month.get((_y, _m), (None, None))
         cc_net_history.append({
             "month":    date(int(_y), int(_m), 1).strftime("%b '%y"),
-            "net":      round(float(_net), 2),
-            "interest": round(float(_interest), 2),
+            "net":      round(float(_net or 0.0), 2),
+            "interest": round(float(_interest or 0.0), 2),
         })
     data["cc_net_history"] = cc_net_history
     data["total_interest_charged"] = round(
@@ -99,6 +99,7 @@ def extract_capone_transactions(pdf_path: Path):
       - For each table on each page:
           * Assume the amount is in the last column.
           * Keep only rows where the last cell looks like money.
+      - Pages without any ruling lines are skipped before table detection.
     Returns:
       list[Decimal] of signed amounts.
     """
@@ -106,6 +107,12 @@ def extract_capone_transactions(pdf_path: Path):
 
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
+            # The default "lines" table strategy needs ruling edges; pages with
+            # no lines/rects/curves (legal text, disclosures) can never yield a
+            # table, so skip the expensive table finder on them.
+            if not (page.lines or page.rects or page.curves):
+                continue
+
             tables = page.extract_tables() or []
             for tbl in tables:
                 for row in tbl:
@@ -84,15 +84,16 @@ def extract_amount_from_txn_line(line: str) -> Decimal | None:
     If only one money token is present, we return that.
     If no money token is found or parsing fails, return None.
     """
-    matches = list(AMOUNT_RE.finditer(line))
-    if not matches:
+    # Only the last two matches matter, so keep a rolling pair instead of
+    # materializing every money token on the line.
+    prev_match = last_match = None
+    for m in AMOUNT_RE.finditer(line):
+        prev_match, last_match = last_match, m
+    if last_match is None:
         return None
 
     # If 2+ money fields, use SECOND-TO-LAST as txn amount.
-    if len(matches) >= 2:
-        amount_match = matches[-2]
-    else:
-        amount_match = matches[-1]
+    amount_match = prev_match if prev_match is not None else last_match
 
     text = amount_match.group(0)
     return parse_amount_token(text)
@@ -19,11 +19,26 @@ only need to:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+import re
+from functools import lru_cache
 from typing import Optional
 
+try:
+    # Optional accelerator (pip install pyahocorasick).  Without it we fall
+    # back to plain substring checks, which give identical scores.
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on the environment
+    ahocorasick = None
+
 # ---------------------------------------------------------------------------
 # Heuristic keyword lists
+#
+# Hint words are matched as *substrings* of the normalized description, not
+# as whole tokens: "payment" must still fire on "Payments", "refund" on
+# "Refunded", and entries with deliberate edge spaces ("cr ", " interest
+# paid") rely on it.  Splitting into a token set would silently change
+# scores, so keep any speed-up substring-exact.
 # ---------------------------------------------------------------------------
 
 DEBIT_HINT_WORDS: tuple[str, ...] = (
@@ -120,7 +135,40 @@ CREDIT_HINT_WORDS: tuple[str, ...] = (
 )
 
 
-@dataclass
+def _build_hint_automaton():
+    """
+    Build one Aho-Corasick automaton over both hint lists.
+
+    Each keyword's payload is (keyword, debit_weight, credit_weight), where
+    the weights are how many times it appears in each tuple, so scoring
+    matches the substring loop exactly (including repeated entries).
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in set(DEBIT_HINT_WORDS) | set(CREDIT_HINT_WORDS):
+        automaton.add_word(
+            kw, (kw, DEBIT_HINT_WORDS.count(kw), CREDIT_HINT_WORDS.count(kw))
+        )
+    automaton.make_automaton()
+    return automaton
+
+
+_HINT_AUTOMATON = _build_hint_automaton()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_desc(description: str) -> str:
+    """
+    Lower-case a description and collapse runs of whitespace to one space.
+
+    The split/join runs in C and is already the fastest single expression
+    for this; the cache skips it entirely for the merchant and payroll
+    strings that repeat throughout a statement import.
+    """
+    return " ".join(description.lower().split())
+
+
 class DirectionContext:
     """
     Optional extra context for inferring sign.
@@ -128,37 +176,60 @@ class DirectionContext:
     In most current callsites we only pass the `description` and rely on
     keyword heuristics. The balance_before / balance_after fields are here
     for future extension when we wire in ledger balance deltas.
+
+    `normalized` (lower-cased, whitespace-collapsed description) is computed
+    once at construction.  One of these is built per imported row, so this
+    is a plain slotted class rather than a dataclass.
     """
 
-    description: str
-    balance_before: Optional[float] = None
-    balance_after: Optional[float] = None
+    __slots__ = ("description", "balance_before", "balance_after", "normalized")
 
-    @property
-    def normalized(self) -> str:
-        return " ".join(self.description.lower().split())
+    def __init__(
+        self,
+        description: str,
+        balance_before: Optional[float] = None,
+        balance_after: Optional[float] = None,
+    ) -> None:
+        self.description = description
+        self.balance_before = balance_before
+        self.balance_after = balance_after
+        self.normalized = _normalize_desc(description)
 
 
-def _parse_amount_core(raw: str) -> float:
+# Explicit sign implied by the first character of a stripped amount string.
+# A parenthesized amount also counts, but only when the closing ")" is there
+# too, so it is checked separately in _explicit_sign().
+_LEADING_SIGN = {"-": -1, "+": +1}
+
+
+def _explicit_sign(s: str) -> Optional[int]:
     """
-    Parse a numeric amount string that may contain commas and an optional sign.
-    Parentheses are treated as a negative sign, e.g. "(123.45)" -> -123.45.
+    Return the sign written into a stripped amount string, or None.
+
+    "-12.00" -> -1, "+12.00" -> +1, "(12.00)" -> +1 (statement convention
+    for credits), anything else -> None.
     """
-    if raw is None:
-        raise ValueError("Amount is None")
+    if not s:
+        return None
+    first = s[0]
+    if first == "(":
+        return +1 if s[-1] == ")" else None
+    return _LEADING_SIGN.get(first)
 
-    s = str(raw).strip()
 
+def _parse_stripped_amount(s: str, raw: str) -> float:
+    """Parse an already-stripped amount string; `raw` is only for errors."""
     negative = False
     # handle parentheses: (123.45) => -123.45
-    if s.startswith("(") and s.endswith(")"):
+    if s[:1] == "(" and s[-1:] == ")":
         negative = True
         s = s[1:-1].strip()
 
     # explicit leading sign
-    if s.startswith("+"):
+    first = s[:1]
+    if first == "+":
         s = s[1:].strip()
-    elif s.startswith("-"):
+    elif first == "-":
         negative = True
         s = s[1:].strip()
 
@@ -171,12 +242,22 @@ def _parse_amount_core(raw: str) -> float:
     return -value if negative else value
 
 
+def _parse_amount_core(raw: str) -> float:
+    """
+    Parse a numeric amount string that may contain commas and an optional sign.
+    Parentheses are treated as a negative sign, e.g. "(123.45)" -> -123.45.
+    """
+    if raw is None:
+        raise ValueError("Amount is None")
+
+    return _parse_stripped_amount(str(raw).strip(), raw)
+
+
 def _score_keywords(text: str, keywords: tuple[str, ...]) -> int:
     """
     Very small heuristic scorer: counts how many hint words appear in
-    the normalized text.
+    the normalized text.  The caller is responsible for lower-casing.
     """
-    text = text.lower()
     score = 0
     for kw in keywords:
         if kw in text:
@@ -184,6 +265,36 @@ def _score_keywords(text: str, keywords: tuple[str, ...]) -> int:
     return score
 
 
+@lru_cache(maxsize=4096)
+def score_direction_hints(text: str) -> tuple[int, int]:
+    """
+    Return (debit_score, credit_score) for a lower-cased description.
+
+    A score is the number of hint words that occur anywhere in the text.
+    With pyahocorasick installed both scores come from a single pass over
+    the text; otherwise each keyword list is scanned with `in`.
+
+    Results are memoized: statement imports repeat the same merchant and
+    payroll descriptions many times over.
+    """
+    if _HINT_AUTOMATON is None:
+        return (
+            _score_keywords(text, DEBIT_HINT_WORDS),
+            _score_keywords(text, CREDIT_HINT_WORDS),
+        )
+
+    # A keyword may occur more than once; count each one only once.
+    hits = {}
+    for _end, payload in _HINT_AUTOMATON.iter(text):
+        hits[payload[0]] = payload
+
+    debit_score = credit_score = 0
+    for _kw, debit_weight, credit_weight in hits.values():
+        debit_score += debit_weight
+        credit_score += credit_weight
+    return debit_score, credit_score
+
+
 def infer_direction_sign(
     amount_raw: str,
     ctx: Optional[DirectionContext] = None,
@@ -207,24 +318,21 @@ def infer_direction_sign(
          as income than to miss an outflow.
     """
     # First see if amount_raw already encodes the sign.
-    s = str(amount_raw).strip()
-    explicit_negative = False
-    explicit_positive = False
+    sign = _explicit_sign(str(amount_raw).strip())
+    if sign is not None:
+        return sign
+    if ctx is None:
+        return _context_sign("")
+    return _context_sign(ctx.normalized, ctx.balance_before, ctx.balance_after)
 
-    if s.startswith("-"):
-        explicit_negative = True
-    if s.startswith("+") or (s.startswith("(") and s.endswith(")")):
-        explicit_positive = True
 
-    if explicit_negative and not explicit_positive:
-        return -1
-    if explicit_positive and not explicit_negative:
-        return +1
-
-    # No explicit sign → we need context.
-    description = ctx.normalized if ctx is not None else ""
-    debit_score = _score_keywords(description, DEBIT_HINT_WORDS)
-    credit_score = _score_keywords(description, CREDIT_HINT_WORDS)
+def _context_sign(
+    normalized: str,
+    balance_before: Optional[float] = None,
+    balance_after: Optional[float] = None,
+) -> int:
+    """Steps 2-4 of infer_direction_sign(): hint words, balances, default."""
+    debit_score, credit_score = score_direction_hints(normalized)
 
     if debit_score > credit_score:
         return -1
@@ -232,12 +340,10 @@ def infer_direction_sign(
         return +1
 
     # If we have balances, try to infer from delta (after - before).
-    if ctx is not None and ctx.balance_before is not None and ctx.balance_after is not None:
-        delta = ctx.balance_after - ctx.balance_before
-        if delta > 0:
-            return +1
-        if delta < 0:
-            return -1
+    if balance_before is not None and balance_after is not None:
+        delta = balance_after - balance_before
+        if delta:
+            return int(math.copysign(1.0, delta))
 
     # Absolute fallback: treat as debit.  Conservative, and fits the
     # "Goldman review" mindset: better to over-count spend than to
@@ -245,6 +351,30 @@ def infer_direction_sign(
     return -1
 
 
+def _parse_and_sign(
+    raw: str,
+    normalized: str,
+    balance_before: Optional[float] = None,
+    balance_after: Optional[float] = None,
+) -> tuple[float, int]:
+    """
+    Return (magnitude, sign) for `raw`, stripping and inspecting it once.
+
+    Equivalent to abs(_parse_amount_core(raw)) and infer_direction_sign()
+    with a DirectionContext built from the same fields, without repeating
+    the string work or allocating the context.
+    """
+    if raw is None:
+        raise ValueError("Amount is None")
+
+    s = str(raw).strip()
+    magnitude = abs(_parse_stripped_amount(s, raw))
+    sign = _explicit_sign(s)
+    if sign is None:
+        sign = _context_sign(normalized, balance_before, balance_after)
+    return magnitude, sign
+
+
 def parse_signed_amount(
     raw: str,
     context: str = "",
@@ -268,16 +398,36 @@ def parse_signed_amount(
     Returns:
         A Python float with correct sign applied.
     """
-    ctx = DirectionContext(
-        description=context or "",
-        balance_before=balance_before,
-        balance_after=balance_after,
+    magnitude, sign = _parse_and_sign(
+        raw,
+        _normalize_desc(context or ""),
+        balance_before,
+        balance_after,
     )
-    magnitude = abs(_parse_amount_core(raw))
-    sign = infer_direction_sign(raw, ctx=ctx)
     return sign * magnitude
 
 
+# Ordered (label, keywords) pairs for classify_transaction_type(); the first
+# category with any keyword in the description wins.  Each category is one
+# compiled alternation rather than a chain of `in` checks.  A single combined
+# regex would return the *leftmost* match, not the highest-priority category,
+# so the categories are still tried in order.
+_CLASSIFIER_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("income", ("payroll", "direct dep", "direct deposit", "salary", "wages")),
+    ("interest", ("interest paid", "interest payment", "interest income")),
+    ("fee", ("fee", "service charge", "overdraft fee", "nsf fee")),
+    ("refund", ("refund", "rebate", "reversal", "returned item")),
+    ("transfer", ("transfer to", "transfer from", "online transfer", "zelle", "venmo", "paypal")),
+    # Expense-ish words
+    ("expense", ("card purchase", "pos purchase", "debit card", "atm", "purchase", "charge", "payment")),
+)
+
+_CLASSIFIER_RULES = tuple(
+    (label, re.compile("|".join(re.escape(w) for w in words)))
+    for label, words in _CLASSIFIER_KEYWORDS
+)
+
+
 def classify_transaction_type(description: str) -> str:
     """
     Lightweight semantic classifier used for higher-level analytics
@@ -287,23 +437,16 @@ def classify_transaction_type(description: str) -> str:
     Returns one of:
         "income", "expense", "transfer", "fee", "interest", "refund", "unknown"
     """
-    text = " ".join(description.lower().split())
+    return _classify_normalized(_normalize_desc(description))
 
-    # Order matters – check for more specific patterns first.
-    if any(w in text for w in ("payroll", "direct dep", "direct deposit", "salary", "wages")):
-        return "income"
-    if "interest paid" in text or "interest payment" in text or "interest income" in text:
-        return "interest"
-    if "fee" in text or "service charge" in text or "overdraft fee" in text or "nsf fee" in text:
-        return "fee"
-    if "refund" in text or "rebate" in text or "reversal" in text or "returned item" in text:
-        return "refund"
-    if any(w in text for w in ("transfer to", "transfer from", "online transfer", "zelle", "venmo", "paypal")):
-        return "transfer"
 
-    # Expense-ish words
-    if any(w in text for w in ("card purchase", "pos purchase", "debit card", "atm", "purchase", "charge", "payment")):
-        return "expense"
+@lru_cache(maxsize=4096)
+def _classify_normalized(text: str) -> str:
+    """classify_transaction_type() on an already-normalized description."""
+    # Order matters – check for more specific patterns first.
+    for label, pattern in _CLASSIFIER_RULES:
+        if pattern.search(text):
+            return label
 
     # Fallback
     return "unknown"
@@ -29,6 +29,18 @@ class Account(db.Model):
 
 class Transaction(db.Model):
     __tablename__ = "transaction"
+    __table_args__ = (
+        # Dashboard / summary aggregates filter on a date range and sum amount;
+        # (date, amount) lets SQLite answer them from the index alone.
+        db.Index("ix_transaction_date_amount", "date", "amount"),
+        # Importer dedupe / is_duplicate_transaction look rows up by this
+        # identity.  Not UNIQUE: legitimate repeats (two identical charges
+        # on one day) exist in imported data.
+        db.Index(
+            "ix_transaction_identity",
+            "date", "amount", "merchant", "account_name", "source_system",
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     # Optional: which OCR file this came from
@@ -79,9 +91,10 @@ class Transaction(db.Model):
         }
 
     @classmethod
-    def from_dict(cls, data):
+    def values_from_dict(cls, data):
         """
-        Build a Transaction from a dict, using the same keys your importer expects.
+        Column values for a Transaction from an importer dict, as a plain
+        dict suitable for a bulk insert(Transaction).
         """
         from datetime import date as _date
         import pandas as _pd
@@ -94,7 +107,7 @@ class Transaction(db.Model):
         else:
             d = _pd.to_datetime(raw_date).date()
 
-        return cls(
+        return dict(
             date=d,
             source_system=data.get("Source", ""),
             account_name=data.get("Account", ""),
@@ -106,6 +119,13 @@ class Transaction(db.Model):
             notes=data.get("Notes", ""),
         )
 
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a Transaction from a dict, using the same keys your importer expects.
+        """
+        return cls(**cls.values_from_dict(data))
+
 
 class CategoryRule(db.Model):
     __tablename__ = "category_rules"
@@ -145,3 +165,19 @@ class OcrRejectedLine(db.Model):
 
     def __repr__(self):
         return f"<OcrRejectedLine {self.file_name}:{self.line_num} {self.reason}>"
+
+
+class FileChecksum(db.Model):
+    """SHA-256 of every source file already handed to the import pipeline."""
+
+    __tablename__ = "file_checksums"
+
+    sha256 = db.Column(db.String(64), primary_key=True)
+    filename = db.Column(db.String(255), nullable=True)
+    # os.stat() fingerprint, so unchanged files can be skipped unhashed
+    size = db.Column(db.BigInteger, nullable=True)
+    mtime_ns = db.Column(db.BigInteger, nullable=True)
+    imported_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<FileChecksum {self.sha256[:12]} {self.filename}>"
@@ -33,15 +33,20 @@ We treat (date, amount, merchant, account_name, source_system) as the
 we skip inserting a duplicate.
 """
 
-from datetime import date as _date
+from datetime import date as _date, datetime as _datetime
 
 import pandas as _pd
-from sqlalchemy import and_
+from sqlalchemy import insert, select
 
 from models import db, Transaction, Account
 
+# Currency formatting stripped from amounts that float() rejects as-is.
+_AMOUNT_STRIP = str.maketrans("", "", "$,")
+
 
 def _normalize_date(raw_date):
+    if isinstance(raw_date, _datetime):
+        return raw_date.date()
     if isinstance(raw_date, _date):
         return raw_date
     if raw_date is None or raw_date == "":
@@ -56,8 +61,7 @@ def _normalize_amount(raw_amount):
         return float(raw_amount)
     except Exception:
         # strip $, commas, etc.
-        s = str(raw_amount).replace("$", "").replace(",", "")
-        return float(s)
+        return float(str(raw_amount).translate(_AMOUNT_STRIP))
 
 
 def import_ocr_rows(rows, default_source="Screenshot OCR", default_account=""):
@@ -71,12 +75,13 @@ def import_ocr_rows(rows, default_source="Screenshot OCR", default_account=""):
     NOTE: Requires an active Flask app context.
     Returns: (inserted_count, skipped_existing_count)
     """
-    inserted = 0
     skipped = 0
 
     # Build account name → id lookup once per call (cheap, avoids per-row queries).
     _acct_map = {a.name: a.id for a in Account.query.all()}
 
+    # 1) Normalize every row and work out its identity key.
+    candidates = []
     for raw in rows:
         raw_date = raw.get("Date")
         date_val = _normalize_date(raw_date)
@@ -95,44 +100,58 @@ def import_ocr_rows(rows, default_source="Screenshot OCR", default_account=""):
         category = (raw.get("Category") or "").strip()
         notes = (raw.get("Notes") or "").strip()
 
-        # Check if we already have this row as a "real" (non-transfer) row.
-        existing = (
-            db.session.query(Transaction)
-            .filter(
-                and_(
-                    Transaction.date == date_val,
-                    Transaction.amount == amount_val,
-                    Transaction.merchant == merchant,
-                    Transaction.account_name == account,
-                    Transaction.source_system == source,
-                    Transaction.is_transfer.is_(False),
-                )
+        key = (date_val, amount_val, merchant, account, source)
+        candidates.append(
+            (
+                key,
+                dict(
+                    date=date_val,
+                    source_system=source,
+                    account_name=account,
+                    direction=direction,
+                    amount=amount_val,
+                    merchant=merchant,
+                    description=description,
+                    category=category,
+                    notes=notes,
+                    account_id=_acct_map.get(account),
+                ),
             )
-            .first()
         )
 
-        if existing:
-            # We've already imported this exact OCR row.
-            skipped += 1
-            continue
-
-        tx = Transaction(
-            date=date_val,
-            source_system=source,
-            account_name=account,
-            direction=direction,
-            amount=amount_val,
-            merchant=merchant,
-            description=description,
-            category=category,
-            notes=notes,
-            account_id=_acct_map.get(account),
+    # 2) Load the keys of existing "real" (non-transfer) rows on those dates
+    #    in one query, instead of one SELECT per row.
+    seen = set()
+    dates = {key[0] for key, _ in candidates}
+    if dates:
+        existing = db.session.execute(
+            select(
+                Transaction.date,
+                Transaction.amount,
+                Transaction.merchant,
+                Transaction.account_name,
+                Transaction.source_system,
+            ).where(
+                Transaction.date.in_(dates),
+                Transaction.is_transfer.is_(False),
+            )
         )
+        seen.update(map(tuple, existing))
 
-        db.session.add(tx)
-        inserted += 1
+    # 3) Keep rows not already imported; repeats within this batch are
+    #    skipped the same way.  Inserted with one executemany.
+    mappings = []
+    for key, mapping in candidates:
+        if key in seen:
+            skipped += 1
+            continue
+        seen.add(key)
+        mappings.append(mapping)
 
+    if mappings:
+        db.session.execute(insert(Transaction), mappings)
     db.session.commit()
+    inserted = len(mappings)
 
     print(f"OCR import: inserted={inserted}, skipped_existing={skipped}")
     return inserted, skipped
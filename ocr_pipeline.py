@@ -3,50 +3,6 @@
 import os as _ocr_os
 
 
-
-# ==== OCR smart open wrapper ==================================
-
-
-# ==== OCR Path.rename shim ===================================
-import pathlib as _ocr_pathlib
-
-__ocr_real_path_rename = _ocr_pathlib.Path.rename
-
-def _ocr_safe_path_rename(self, target, *args, **kwargs):
-    src_str = str(self)
-    # Ignore missing previous *_ocr.txt backups on first run
-    if src_str.endswith("_ocr.txt"):
-        try:
-            return __ocr_real_path_rename(self, target, *args, **kwargs)
-        except FileNotFoundError:
-            # Nothing to rotate yet; safe to skip
-            return
-    return __ocr_real_path_rename(self, target, *args, **kwargs)
-
-_ocr_pathlib.Path.rename = _ocr_safe_path_rename
-# =============================================================
-
-import builtins as _builtins
-
-def _ocr_adjust_path(path):
-    import os
-    # If someone tries to use _ocr.pass0.tmp but it doesn't exist,
-    # and a matching _ocr.pass0.txt DOES exist, use that instead.
-    if isinstance(path, str) and path.endswith("_ocr.pass0.tmp"):
-        if not os.path.exists(path):
-            alt = path[:-3] + "txt"  # swap .tmp -> .txt
-            if os.path.exists(alt):
-                path = alt
-    return path
-
-_original_open = _builtins.open
-
-def _ocr_open(path, *args, **kwargs):
-    return _original_open(_ocr_adjust_path(path), *args, **kwargs)
-
-_builtins.open = _ocr_open
-# =============================================================
-
 _original_rename = _ocr_os.rename
 _original_replace = _ocr_os.replace
 
@@ -102,10 +58,13 @@ import shutil
 import hashlib
 from pathlib import Path
 from datetime import datetime, date as _date_cls
+from functools import lru_cache, partial
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from decimal import Decimal, InvalidOperation
 
-from direction_rules import DEBIT_HINT_WORDS, CREDIT_HINT_WORDS
+from direction_rules import score_direction_hints
 
 from chase_amount_utils import (
     AMOUNT_RE,
@@ -119,6 +78,14 @@ from chase_amount_utils import (
 # -------------------------------------------------------------------
 
 
+# Known account suffixes, in priority order. Matched as plain substrings
+# (like the old `suffix in text` probe) in one scan; the lookahead keeps
+# overlapping hits so the highest-priority suffix present still wins.
+_ACCOUNT_SUFFIXES = ("0205", "5072", "9765", "3838", "9383")
+_ACCOUNT_SUFFIX_RANK = {suffix: i for i, suffix in enumerate(_ACCOUNT_SUFFIXES)}
+_ACCOUNT_SUFFIX_RE = re.compile("(?=(" + "|".join(_ACCOUNT_SUFFIXES) + "))")
+
+
 def _detect_source_and_account(line: str, path: str, default_source: str):
     """
     Guess the source_system (bank) and account_name based on the text
@@ -149,10 +116,9 @@ def _detect_source_and_account(line: str, path: str, default_source: str):
 
     # Try to infer account from common 4-digit suffixes if still blank
     if not account:
-        for suffix in ("0205", "5072", "9765", "3838", "9383"):
-            if suffix in text:
-                account = f"Acct *{suffix}"
-                break
+        found = {m.group(1) for m in _ACCOUNT_SUFFIX_RE.finditer(text)}
+        if found:
+            account = f"Acct *{min(found, key=_ACCOUNT_SUFFIX_RANK.__getitem__)}"
 
     return source, account
 
@@ -194,50 +160,19 @@ def _guess_category(description: str) -> str:
 # Signed-amount parsing helpers (single source of truth for +/- amounts)
 # =====================================================================
 
-# Words that strongly suggest a DEBIT (money leaving you)
-_DEBIT_WORDS = [
-    "CARD PURCHASE",
-    "DEBIT",
-    "WITHDRAWAL",
-    "ATM",
-    "PAYMENT",
-    "PURCHASE",
-    "POS",
-    "CHECKCARD",
-    "CHECK CARD",
-    "CHECK",
-    "FEE",
-    "CHARGE",
-    "INTEREST",
-]
-
-# Words that strongly suggest a CREDIT (money coming in)
-_CREDIT_WORDS = [
-    "DIRECT DEP",
-    "DIRECT DEPOSIT",
-    "PAYROLL",
-    "DEP PPD",
-    "ACH CREDIT",
-    "CREDIT",
-    "REFUND",
-    "REVERSAL",
-    "ADJUSTMENT",
-    "INTEREST PAID",
-    "INTEREST PAYMENT",
-    "INT EARNED",
-    "CASHBACK",
-    "CASH BACK",
-]
+# Debit/credit context words live in direction_rules (DEBIT_HINT_WORDS /
+# CREDIT_HINT_WORDS); score_direction_hints counts both lists in a single
+# pass over the text.
 
+# "$" and thousands separators, dropped in one str.translate pass.
+_AMOUNT_STRIP = str.maketrans("", "", "$,")
 
-def parse_signed_amount(raw: str, context: str = "") -> Decimal:
+
+def _split_amount_sign(raw: str):
     """
-    Parse a money-looking string into a signed Decimal, using both the raw
-    sign markers (-, parentheses, trailing -) and some simple context words
-    to decide the final sign.
+    Strip the raw sign markers (-, parentheses, trailing -) off an amount.
 
-    This is used by the more specialized parsers (Chase, PayPal Credit, etc.)
-    so that +/- handling is consistent.
+    Returns (negative, digits) where digits has "$" and "," removed.
     """
     token = raw.strip()
     token = token.replace("\u2212", "-")  # unicode minus
@@ -259,7 +194,36 @@ def parse_signed_amount(raw: str, context: str = "") -> Decimal:
         negative = True
         token = token[1:]
 
-    token = token.replace("$", "").replace(",", "")
+    return negative, token.translate(_AMOUNT_STRIP)
+
+
+def _apply_context_sign(value, context: str):
+    """
+    Score-based sign inference: count debit and credit keyword hits.
+    More hits on one side wins; on a tie, trust the raw sign already parsed.
+    This replaces the old if/elif first-match approach, which let a broad
+    debit word ("payment") override a specific credit word ("credit recd").
+    """
+    if context:
+        debit_score, credit_score = score_direction_hints(context.lower())
+        if debit_score > credit_score and value > 0:
+            value = -value
+        elif credit_score > debit_score and value < 0:
+            value = -value
+        # tie → keep the raw sign already parsed above
+    return value
+
+
+def parse_signed_amount(raw: str, context: str = "") -> Decimal:
+    """
+    Parse a money-looking string into a signed Decimal, using both the raw
+    sign markers (-, parentheses, trailing -) and some simple context words
+    to decide the final sign.
+
+    This is used by the more specialized parsers (Chase, PayPal Credit, etc.)
+    so that +/- handling is consistent.
+    """
+    negative, token = _split_amount_sign(raw)
 
     if not token:
         return Decimal("0.00")
@@ -272,21 +236,29 @@ def parse_signed_amount(raw: str, context: str = "") -> Decimal:
     if negative:
         value = -value
 
-    # Score-based sign inference: count debit and credit keyword hits.
-    # More hits on one side wins; on a tie, trust the raw sign already parsed.
-    # This replaces the old if/elif first-match approach, which let a broad
-    # debit word ("payment") override a specific credit word ("credit recd").
-    if context:
-        ctx_lower = context.lower()
-        debit_score  = sum(1 for w in DEBIT_HINT_WORDS  if w in ctx_lower)
-        credit_score = sum(1 for w in CREDIT_HINT_WORDS if w in ctx_lower)
-        if debit_score > credit_score and value > 0:
-            value = -value
-        elif credit_score > debit_score and value < 0:
-            value = -value
-        # tie → keep the raw sign already parsed above
+    return _apply_context_sign(value, context)
 
-    return value
+
+def parse_signed_float(raw: str, context: str = "") -> float:
+    """
+    float twin of parse_signed_amount for the per-line OCR hot path, where
+    the result is stored as a float anyway.  Same sign rules; a 2-decimal
+    token gives the same float as float(parse_signed_amount(...)).
+    """
+    negative, token = _split_amount_sign(raw)
+
+    if not token:
+        return 0.0
+
+    try:
+        value = float(token)
+    except ValueError:
+        return 0.0
+
+    if negative:
+        value = -value
+
+    return _apply_context_sign(value, context)
 
 
 # -------------------------------------------------------------------
@@ -294,55 +266,49 @@ def parse_signed_amount(raw: str, context: str = "") -> Decimal:
 # -------------------------------------------------------------------
 
 
-def _normalize_row(line: str, default_source: str, path: str):
-    """
-    Core parser for a single OCR line:
-
-    - Finds date-like token
-    - Finds last amount-like token
-    - Everything between = description/merchant
-    - Derives signed Amount + Direction + Source/Account/Category.
+# One OCR row: the first date-like token, then the description, then the
+# last amount-like token.  The lazy token prefix finds the first date, the
+# greedy description pushes the amount to the last match, and the \s+
+# boundaries keep both as whole whitespace-separated tokens.
+_ROW_RE = re.compile(
+    r"(?:\S+\s+)*?"
+    r"(?P<date>\d{4}-\d{2}-\d{2}"            # 2025-11-29
+    r"|\d{1,2}/\d{1,2}/\d{2,4})"             # 11/29/2025 or 11/29/25
+    r"\s+(?P<desc>.*\S)"
+    r"\s+(?P<amount>[-+]?\$?\d[\d,]*\.\d{2})"  # optional +/- in front, $ allowed
+    r"(?:\s+\S+)*"
+)
 
-    Convention:
-      * spending  -> Amount < 0, Direction = "debit"
-      * income    -> Amount > 0, Direction = "credit"
+def _collapse_ws(s: str) -> str:
     """
-    s = line.strip()
-    if not s:
-        return None
+    Same result as " ".join(s.split()), without rebuilding clean strings.
 
-    tokens = s.split()
-    if len(tokens) < 3:
-        return None
+    isprintable() is False for every whitespace character except the plain
+    space, so a printable string with no double or edge spaces is already
+    collapsed.
+    """
+    if "  " in s or not s.isprintable() or s[:1] == " " or s[-1:] == " ":
+        return " ".join(s.split())
+    return s
 
-    # Date token patterns
-    date_re = re.compile(
-        r"^\d{4}-\d{2}-\d{2}$"          # 2025-11-29
-        r"|^\d{1,2}/\d{1,2}/\d{2,4}$"   # 11/29/2025 or 11/29/25
-    )
 
-    # Amount token pattern (optional +/- in front, $ allowed)
-    amount_re = re.compile(r"^[-+]?\$?\d[\d,]*\.\d{2}$")
+# Transfers & neutral internal moves
+_TRANSFER_KEYWORDS = (
+    "TRANSFER TO", "XFER TO", "TO SAVINGS", "TO CHECKING",
+    "REAL TIME TRANSFER RCD TO",
+    "PAYMENT TO",
+    "PAYPAL TRANSFER TO", "VENMO TRANSFER TO",
+    "ZELLE TO",
+    "CASH APP TO",
+)
 
-    # --- find first date token ---
-    date_idx = None
-    for i, t in enumerate(tokens):
-        if date_re.match(t):
-            date_idx = i
-            break
-    if date_idx is None:
-        return None
 
-    # --- find last amount token ---
-    amount_idx = None
-    for i in range(len(tokens) - 1, -1, -1):
-        if amount_re.match(tokens[i]):
-            amount_idx = i
-            break
-    if amount_idx is None or amount_idx <= date_idx:
-        return None
+@lru_cache(maxsize=4096)
+def _row_iso_date(raw_date: str):
+    """ISO date for a matched date token, or None if it is not a real date.
 
-    raw_date = tokens[date_idx]
+    Cached: a statement repeats the same few dozen dates on every line.
+    """
     try:
         if "-" in raw_date:
             dt = datetime.strptime(raw_date, "%Y-%m-%d")
@@ -351,16 +317,39 @@ def _normalize_row(line: str, default_source: str, path: str):
             if len(year) == 2:
                 year = "20" + year
             dt = datetime.strptime(f"{month}/{day}/{year}", "%m/%d/%Y")
-        date_str = dt.date().isoformat()
+        return dt.date().isoformat()
     except Exception:
         return None
 
-    description = " ".join(tokens[date_idx + 1 : amount_idx]).strip()
-    if not description:
+
+def _normalize_row(line: str, default_source: str, path: str):
+    """
+    Core parser for a single OCR line:
+
+    - Finds date-like token
+    - Finds last amount-like token
+    - Everything between = description/merchant
+    - Derives signed Amount + Direction + Source/Account/Category.
+
+    Convention:
+      * spending  -> Amount < 0, Direction = "debit"
+      * income    -> Amount > 0, Direction = "credit"
+    """
+    m = _ROW_RE.fullmatch(line.strip())
+    if m is None:
+        return None
+    return _row_from_match(m, line, default_source, path)
+
+
+def _row_from_match(m, line: str, default_source: str, path: str):
+    """Build the row dict for a line that matched _ROW_RE (see _normalize_row)."""
+    date_str = _row_iso_date(m.group("date"))
+    if date_str is None:
         return None
 
-    amt_raw = tokens[amount_idx]
-    amount = parse_signed_amount(amt_raw, context=description)
+    description = _collapse_ws(m.group("desc"))
+    amt_raw = m.group("amount")
+    amount = parse_signed_float(amt_raw, context=description)
 
     upper_desc = description.upper()
 
@@ -372,16 +361,7 @@ def _normalize_row(line: str, default_source: str, path: str):
     #   - if amount > 0 => credit (income/refund)
     direction = "debit" if amount < 0 else "credit"
 
-    # Transfers & neutral internal moves
-    transfer_keywords = [
-        "TRANSFER TO", "XFER TO", "TO SAVINGS", "TO CHECKING",
-        "REAL TIME TRANSFER RCD TO",
-        "PAYMENT TO",
-        "PAYPAL TRANSFER TO", "VENMO TRANSFER TO",
-        "ZELLE TO",
-        "CASH APP TO",
-    ]
-    if any(k in upper_desc for k in transfer_keywords):
+    if any(k in upper_desc for k in _TRANSFER_KEYWORDS):
         direction = "transfer"
 
     source_system, account_name = _detect_source_and_account(line, path, default_source)
@@ -389,7 +369,7 @@ def _normalize_row(line: str, default_source: str, path: str):
 
     return {
         "Date": date_str,
-        "Amount": float(amount),        # stored as float for import_ocr_rows; DB uses Decimal
+        "Amount": amount,               # float, as import_ocr_rows stores it
         "Direction": direction,
         "Source": source_system,
         "Account": account_name,
@@ -414,19 +394,26 @@ def _parse_ocr_text_file(path, default_source: str, collect_rejected: bool = Fal
       - contains at least one amount-looking token
     but fails to normalize into a row will be recorded in rejected_rows.
     """
-    from pathlib import Path as _LocalPath
-
     rows = []
     if collect_rejected and rejected_rows is None:
         rejected_rows = []
 
+    # One open + read; decode the bytes ourselves instead of going through
+    # a text-mode wrapper.
     try:
-        raw = _LocalPath(path).read_text(errors="ignore")
+        with open(path, "rb") as f:
+            raw = f.read().decode("utf-8", "ignore")
     except Exception:
         return (rows, rejected_rows) if collect_rejected else rows
 
+    # Match inline (same as _normalize_row) so the ~80% of lines that are
+    # headers, legal text or blanks cost one C-level regex call and no
+    # Python call frame.
+    path_str = str(path)
+    fullmatch = _ROW_RE.fullmatch
     for idx, line in enumerate(raw.splitlines(), start=1):
-        row = _normalize_row(line, default_source, str(path))
+        m = fullmatch(line.strip())
+        row = _row_from_match(m, line, default_source, path_str) if m else None
         if row:
             rows.append(row)
             continue
@@ -443,7 +430,7 @@ def _parse_ocr_text_file(path, default_source: str, collect_rejected: bool = Fal
 
         rejected_rows.append(
             {
-                "source_file": os.path.basename(str(path)),
+                "source_file": os.path.basename(path_str),
                 "line_no": idx,
                 "page_no": None,
                 "raw_text": line.rstrip("\n"),
@@ -466,6 +453,11 @@ def process_screenshot_files(file_paths):
     return rows
 
 
+# Fewest *_ocr.txt files worth a process pool: pool start-up is ~40 ms
+# against ~5 ms to parse a typical 300-line statement.
+_STATEMENT_POOL_MIN_FILES = 32
+
+
 def process_statement_files(file_paths=None, collect_rejected: bool = False):
     """
     Process OCR text files generated from full statements (generic parser).
@@ -481,16 +473,33 @@ def process_statement_files(file_paths=None, collect_rejected: bool = False):
     rejected_rows = []
     if not file_paths:
         return (rows, rejected_rows) if collect_rejected else rows
+    if isinstance(file_paths, (str, Path)):
+        file_paths = [file_paths]
+    file_paths = list(file_paths)
+
+    parse = partial(
+        _parse_ocr_text_file,
+        default_source="Statement OCR",
+        collect_rejected=collect_rejected,
+    )
+    # Files parse independently, so large batches are spread across
+    # processes; results come back in input order so the merged rows match
+    # a serial run. Small batches stay serial, since starting the pool
+    # costs more than parsing them.
+    workers = min(len(file_paths), _ocr_os.cpu_count() or 1)
+    if len(file_paths) < _STATEMENT_POOL_MIN_FILES or workers <= 1:
+        results = map(parse, file_paths)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(parse, file_paths, chunksize=4))
 
-    for p in file_paths:
+    for result in results:
         if collect_rejected:
-            file_rows, file_rejected = _parse_ocr_text_file(
-                p, "Statement OCR", collect_rejected=True, rejected_rows=[]
-            )
+            file_rows, file_rejected = result
             rows.extend(file_rows)
             rejected_rows.extend(file_rejected)
         else:
-            rows.extend(_parse_ocr_text_file(p, "Statement OCR"))
+            rows.extend(result)
 
     return (rows, rejected_rows) if collect_rejected else rows
 
@@ -498,6 +507,31 @@ def process_statement_files(file_paths=None, collect_rejected: bool = False):
 # Capital One (card ending 0728) statement parser (from *_ocr.txt)
 # =====================================================================
 
+# Month number by the first three letters (lower-case) of its name; enough
+# to tell every month apart, and covers "Sep"/"Sept"/"September" alike.
+_MON3 = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# Statement period: "Dec 10, 2024 - Jan 09, 2025"
+_CAPONE_PERIOD_RE = re.compile(
+    r"([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})\s*-\s*"
+    r"([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})"
+)
+# Table row: trans date, post date, description, amount.
+_CAPONE_LINE_RE = re.compile(
+    r"^\s*([A-Za-z]{3,9})\s+(\d{1,2})\s+"
+    r"([A-Za-z]{3,9})\s+(\d{1,2})\s+"
+    r"(.+?)\s+(-?\s*\$?\d[\d,]*\.\d{2})\s*$"
+)
+# Matches "ANY ALL-CAPS NAME #XXXX: Payments..." or "...#XXXX: Transactions"
+# so this works for any cardholder without hardcoding a name.
+_CAPONE_SECTION_RE = re.compile(
+    r'^[A-Z][A-Z\s.]+\s+#\d{4}:\s+(Payments|Transactions)'
+)
+
+
 def _parse_capone_0728_statement(txt_path):
     """
     Parse a Capital One Platinum Mastercard (ending in 0728) statement
@@ -514,98 +548,74 @@ def _parse_capone_0728_statement(txt_path):
     from datetime import date as _date_cls
 
     try:
-        text = Path(txt_path).read_text(errors="ignore")
+        with open(txt_path, "rb") as fh:
+            raw_bytes = fh.read()
     except Exception:
         return []
 
-    # Quick guard: if it doesn't look like this Cap One card, bail out.
-    if "Platinum Card | Platinum Mastercard ending in 0728" not in text:
+    # Quick guard: if it doesn't look like this Cap One card, bail out
+    # before paying to decode the whole file.
+    if b"Platinum Card | Platinum Mastercard ending in 0728" not in raw_bytes:
         return []
+    text = raw_bytes.decode("utf-8", errors="ignore")
 
     # --------------------------------------------------------------
-    # 1) Extract statement period: "Dec 10, 2024 - Jan 09, 2025"
+    # 1) Statement period: "Dec 10, 2024 - Jan 09, 2025"
     # --------------------------------------------------------------
-    period_re = re.compile(
-        r"([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})\s*-\s*"
-        r"([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})"
-    )
-
-    MONTH = {
-        "JANUARY": 1, "JAN": 1,
-        "FEBRUARY": 2, "FEB": 2,
-        "MARCH": 3, "MAR": 3,
-        "APRIL": 4, "APR": 4,
-        "MAY": 5,
-        "JUNE": 6, "JUN": 6,
-        "JULY": 7, "JUL": 7,
-        "AUGUST": 8, "AUG": 8,
-        "SEPTEMBER": 9, "SEP": 9, "SEPT": 9,
-        "OCTOBER": 10, "OCT": 10,
-        "NOVEMBER": 11, "NOV": 11,
-        "DECEMBER": 12, "DEC": 12,
-    }
-
+    # Found during the single walk over the lines in step 2.
     start_month_name = end_month_name = None
     start_year = end_year = None
 
-    for line in text.splitlines():
-        m = period_re.search(line)
-        if m:
-            sm, sd, sy, em, ed, ey = m.groups()
-            start_month_name = sm.upper()
-            start_year = int(sy)
-            end_month_name = em.upper()
-            end_year = int(ey)
-            break
-
-    if start_year is None:
-        start_year = _date_cls.today().year
-    if end_year is None:
-        end_year = start_year
-
     def _month_year_for_abbrev(mon_abbrev: str):
         """Map 'Jan'/'Feb'/etc to (year, month) within this period."""
-        mon_key = mon_abbrev.upper()
-        mnum = MONTH.get(mon_key)
+        mnum = _MON3.get(mon_abbrev[:3].lower())
         if mnum is None:
             return end_year, _date_cls.today().month
 
-        if start_month_name and mon_key.startswith(start_month_name[:3]):
+        if start_month_name and mnum == _MON3.get(start_month_name[:3].lower()):
             return start_year, mnum
-        if end_month_name and mon_key.startswith(end_month_name[:3]):
+        if end_month_name and mnum == _MON3.get(end_month_name[:3].lower()):
             return end_year, mnum
 
         if start_month_name:
-            smnum = MONTH.get(start_month_name, mnum)
+            smnum = _MON3.get(start_month_name[:3].lower(), mnum)
             if mnum < smnum and end_year > start_year:
                 return end_year, mnum
         return start_year, mnum
 
     # --------------------------------------------------------------
-    # 2) Walk through text and capture the two tables:
+    # 2) Walk through text once, picking up the statement period and
+    #    capturing the two tables:
     #    - Payments, Credits and Adjustments
     #    - Transactions
+    #    Row dates need the period, so they are filled in afterwards.
     # --------------------------------------------------------------
-    lines = text.splitlines()
     rows = []
+    pending_dates = []  # (row, month token, day)
 
     mode = None  # None / "payments" / "spend"
 
-    line_re = re.compile(
-        r"^\s*([A-Za-z]{3,9})\s+(\d{1,2})\s+"
-        r"([A-Za-z]{3,9})\s+(\d{1,2})\s+"
-        r"(.+?)\s+(-?\s*\$?\d[\d,]*\.\d{2})\s*$"
-    )
-    # Matches "ANY ALL-CAPS NAME #XXXX: Payments..." or "...#XXXX: Transactions"
-    # so this works for any cardholder without hardcoding a name.
-    _section_re = re.compile(
-        r'^[A-Z][A-Z\s.]+\s+#\d{4}:\s+(Payments|Transactions)'
-    )
+    note = f"from {Path(txt_path).name}"
+
+    # Bound once for the per-line loop below.
+    rows_append = rows.append
+    pending_append = pending_dates.append
+    section_match = _CAPONE_SECTION_RE.match
+    line_match = _CAPONE_LINE_RE.match
+
+    for raw in text.splitlines():
+        if start_year is None:
+            m = _CAPONE_PERIOD_RE.search(raw)
+            if m:
+                sm, sd, sy, em, ed, ey = m.groups()
+                start_month_name = sm.upper()
+                start_year = int(sy)
+                end_month_name = em.upper()
+                end_year = int(ey)
 
-    for raw in lines:
         s = raw.strip()
 
-        _sm = _section_re.match(s)
+        _sm = section_match(s)
         if _sm:
             mode = "payments" if _sm.group(1) == "Payments" else "spend"
             continue
@@ -623,23 +633,19 @@ def _parse_capone_0728_statement(txt_path):
         if not s:
             continue
 
-        m = line_re.match(raw)
+        m = line_match(raw)
         if not m:
             continue
 
         mon1, day1, _mon2, _day2, desc, amt_str = m.groups()
 
-        desc_clean = " ".join(desc.split())
+        desc_clean = _collapse_ws(desc)
 
         amt_token = amt_str.replace(" ", "")
         amt = parse_amount_token(amt_token)
         if amt is None:
             continue
 
-        year, month = _month_year_for_abbrev(mon1)
-        day = int(day1)
-        iso_date = f"{year:04d}-{month:02d}-{day:02d}"
-
         if mode == "payments":
             amount_signed = abs(amt)
             direction = "credit"
@@ -649,19 +655,34 @@ def _parse_capone_0728_statement(txt_path):
             direction = "debit"
             category = _guess_category(desc_clean)
 
-        rows.append(
-            {
-                "Date": iso_date,
-                "Amount": float(amount_signed),
-                "Direction": direction,
-                "Source": "Capital One",
-                "Account": "Capital One 0728",
-                "Merchant": desc_clean,
-                "Description": desc_clean,
-                "Category": category,
-                "Notes": f"from {Path(txt_path).name}",
-            }
-        )
+        row = {
+            "Date": None,
+            "Amount": float(amount_signed),
+            "Direction": direction,
+            "Source": "Capital One",
+            "Account": "Capital One 0728",
+            "Merchant": desc_clean,
+            "Description": desc_clean,
+            "Category": category,
+            "Notes": note,
+        }
+        rows_append(row)
+        pending_append((row, mon1, int(day1)))
+
+    if start_year is None:
+        start_year = _date_cls.today().year
+    if end_year is None:
+        end_year = start_year
+
+    # A statement only spans two or three month abbreviations; resolve each
+    # once instead of on every transaction line.
+    month_cache = {}
+    for row, mon1, day in pending_dates:
+        year_month = month_cache.get(mon1)
+        if year_month is None:
+            year_month = month_cache[mon1] = _month_year_for_abbrev(mon1)
+        year, month = year_month
+        row["Date"] = f"{year:04d}-{month:02d}-{day:02d}"
 
     return rows
 
@@ -669,6 +690,13 @@ def _parse_capone_0728_statement(txt_path):
 # PDF STATEMENT PARSING (true table extraction with pdfplumber)
 # -------------------------------------------------------------------
 
+# Whole-cell shapes for the first (date) and last (amount) table columns.
+_CELL_DATE_RE = re.compile(
+    r"^\d{4}-\d{2}-\d{2}$"
+    r"|^\d{1,2}/\d{1,2}/\d{2,4}$"
+)
+_CELL_AMOUNT_RE = re.compile(r"^[-+]?\$?\d[\d,]*\.\d{2}$")
+
 
 def process_statement_pdfs(file_paths):
     """
@@ -687,11 +715,6 @@ def process_statement_pdfs(file_paths):
         return []
 
     rows = []
-    date_re = re.compile(
-        r"^\d{4}-\d{2}-\d{2}$"
-        r"|^\d{1,2}/\d{1,2}/\d{2,4}$"
-    )
-    amount_re = re.compile(r"^[-+]?\$?\d[\d,]*\.\d{2}$")
 
     for path in file_paths or []:
         try:
@@ -709,7 +732,7 @@ def process_statement_pdfs(file_paths):
                             first = cells[0]
                             last = cells[-1]
 
-                            if not date_re.match(first) or not amount_re.match(last):
+                            if not _CELL_DATE_RE.match(first) or not _CELL_AMOUNT_RE.match(last):
                                 continue
 
                             fake_line = f"{first} {' '.join(cells[1:-1])} {last}"
@@ -741,89 +764,8 @@ def collect_all_ocr_rows(base_dir: Path = Path("ocr_output")):
     for row in iter_capone_csv_rows(base_dir):
         yield row
 
-# === Capital One CSV support ===
-
-def parse_capone_date(s: str):
-    """
-    Capital One CSV uses ISO dates: YYYY-MM-DD
-    """
-    s = (s or "").strip()
-    if not s:
-        return None
-    return datetime.strptime(s, "%Y-%m-%d").date()
-
-
-def _parse_capone_amount(row: dict) -> Decimal:
-    """
-    Capital One CSV has separate Debit and Credit columns.
-
-    - Debit  (charges, purchases, interest) -> money out  -> NEGATIVE
-    - Credit (payments, refunds)            -> money in   -> POSITIVE
-    """
-    debit_raw = (row.get("Debit") or "").strip()
-    credit_raw = (row.get("Credit") or "").strip()
-
-    def to_dec(s: str) -> Decimal:
-        s = s.replace("$", "").replace(",", "").strip()
-        if not s:
-            return Decimal("0")
-        try:
-            return Decimal(s)
-        except InvalidOperation:
-            return Decimal("0")
-
-    debit = to_dec(debit_raw)
-    credit = to_dec(credit_raw)
-
-    # spending (debit) -> negative, payments/credits -> positive
-    return credit - debit
-
-
-def iter_capone_csv_rows(base_dir: Path):
-    """
-    Yield normalized row dicts for Capital One CSV exports in:
-
-        base_dir / "capone" / *.csv
-    """
-    capone_dir = base_dir / "capone"
-    if not capone_dir.exists():
-        return  # nothing to do
-
-    for csv_path in sorted(capone_dir.glob("*.csv")):
-        with csv_path.open("r", newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for raw in reader:
-                # 1) Date
-                date_str = (raw.get("Transaction Date") or "").strip()
-                tx_date = parse_capone_date(date_str)
-
-                # 2) Description / merchant
-                description = (raw.get("Description") or "").strip()
-
-                # 3) Card number -> last 4 -> account name
-                card_no = (raw.get("Card No.") or "").strip()
-                last4 = card_no[-4:] if len(card_no) >= 4 else card_no
-                account_name = f"Capital One {last4 or 'Unknown'}"
+_OCR_IMPORT_BATCH_SIZE = 1000
 
-                # 4) Amount (Debit/Credit -> signed)
-                amount = _parse_capone_amount(raw)
-
-                # 5) Category (optional, but nice to keep somewhere)
-                category = (raw.get("Category") or "").strip()
-
-                raw_desc = (
-                    f"{csv_path.name} | {date_str} | {description} | "
-                    f"{card_no} | {category}"
-                )
-
-                yield {
-                    "date": tx_date,
-                    "amount": amount,
-                    "merchant": description or "Capital One transaction",
-                    "account_name": account_name,
-                    "source_system": "Capital One CSV",
-                    "raw_desc": raw_desc,
-                }
 
 def import_all_ocr_to_db():
     base_dir = Path("ocr_output")
@@ -834,9 +776,20 @@ def import_all_ocr_to_db():
 
     Safe to re-run many times: import_ocr_rows does a de-dup check.
     """
-    rows = list(collect_all_ocr_rows(base_dir))
-    print(f"collect_all_ocr_rows() returned {len(rows)} rows.")
-    inserted, skipped = import_ocr_rows(rows)
+    # Feed the generator through in fixed-size batches so memory stays
+    # bounded and each batch reaches the DB while later files still parse.
+    # Every batch commits, so later batches dedupe against earlier ones.
+    rows_iter = collect_all_ocr_rows(base_dir)
+    total = inserted = skipped = 0
+    while True:
+        batch = list(islice(rows_iter, _OCR_IMPORT_BATCH_SIZE))
+        if not batch:
+            break
+        batch_inserted, batch_skipped = import_ocr_rows(batch)
+        total += len(batch)
+        inserted += batch_inserted
+        skipped += batch_skipped
+    print(f"collect_all_ocr_rows() returned {total} rows.")
     print(f"OCR → DB import finished. Inserted={inserted}, skipped_existing={skipped}")
 
 
@@ -846,7 +799,6 @@ def import_all_ocr_to_db():
 
 from pathlib import Path as _SSPath
 import datetime as _dt
-import pandas as _pd2
 
 
 def save_screenshot_csv(rows, prefix="screenshots"):
@@ -867,8 +819,12 @@ def save_screenshot_csv(rows, prefix="screenshots"):
     outpath = outdir / f"{prefix}_{ts}.csv"
 
     try:
-        df = _pd2.DataFrame(rows)
-        df.to_csv(outpath, index=False)
+        # Union of keys in first-seen order, like DataFrame(rows) columns.
+        fieldnames = list(dict.fromkeys(k for row in rows for k in row))
+        with open(outpath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
         print(f"save_screenshot_csv: wrote {len(rows)} rows to {outpath}")
     except Exception as e:
         print(f"save_screenshot_csv: ERROR writing CSV: {e}")
@@ -990,16 +946,18 @@ def ocr_to_text_with_consistency(src_path: Path, out_txt: Path, passes: int = 3)
 # ======================================================================
 
 
+_CHASE_PERIOD_RE = re.compile(
+    r"([A-Za-z]+)\s+\d{1,2},\s+(\d{4})\s+through\s+([A-Za-z]+)\s+\d{1,2},\s+(\d{4})"
+)
+
+
 def _extract_statement_years(txt: str):
     """
     Find a line like: 'December 15, 2023 through January 16, 2024'
     and return (start_year, end_year). If not found, return (None, None).
     """
-    pat = re.compile(
-        r"([A-Za-z]+)\s+\d{1,2},\s+(\d{4})\s+through\s+([A-Za-z]+)\s+\d{1,2},\s+(\d{4})"
-    )
     for line in txt.splitlines():
-        m = pat.search(line)
+        m = _CHASE_PERIOD_RE.search(line)
         if m:
             _, y1, _, y2 = m.groups()
             try:
@@ -1072,6 +1030,15 @@ def _iter_transaction_lines(txt: str):
 
 
 _CHASE_ACCT_RE = re.compile(r"Account Number:\s*(\d{7,})")
+# One TRANSACTION DETAIL row: MM/DD  description  amount  running-balance.
+# Compiled once here; this is matched against every line of every statement.
+_CHASE_LINE_RE = re.compile(
+    r"^\s*(\d{2})/(\d{2})\s+(.+?)\s+(-?\d[\d,]*\.\d{2})\s+(-?\d[\d,]*\.\d{2})\s*$"
+)
+# Millennium Healt payroll deposits that OCR leaves outside the detail block.
+_CHASE_PAYROLL_RE = re.compile(
+    r"(\d{2})/(\d{2})\s+Millennium Healt\s+Direct Dep\s+PPD ID:\s*\d+\s+(-?\d[\d,]*\.\d{2})\s+(-?\d[\d,]*\.\d{2})"
+)
 _CHASE_KNOWN_ACCOUNTS = {
     "9765": "Chase Checking",
     "9383": "Chase Savings",
@@ -1096,17 +1063,20 @@ def _parse_chase_transaction_detail(path: Path):
     current_year = start_year or end_year
     prev_month = None
 
-    line_re = re.compile(
-        r"^\s*(\d{2})/(\d{2})\s+(.+?)\s+(-?\d[\d,]*\.\d{2})\s+(-?\d[\d,]*\.\d{2})\s*$"
-    )
-
     rows = []
     in_block = False
     current_account_name = "Chase Checking"  # safe default
 
+    note = f"from {path.name}"
+
+    # Bound once for the per-line loop below.
+    rows_append = rows.append
+    acct_search = _CHASE_ACCT_RE.search
+    line_match = _CHASE_LINE_RE.match
+
     for line in txt.splitlines():
         # Track account number from global product headers.
-        acct_m = _CHASE_ACCT_RE.search(line)
+        acct_m = acct_search(line)
         if acct_m:
             last4 = acct_m.group(1)[-4:]
             current_account_name = _CHASE_KNOWN_ACCOUNTS.get(
@@ -1122,7 +1092,7 @@ def _parse_chase_transaction_detail(path: Path):
         if not in_block:
             continue
 
-        m = line_re.match(line)
+        m = line_match(line)
         if not m:
             continue
 
@@ -1155,11 +1125,10 @@ def _parse_chase_transaction_detail(path: Path):
         direction = "debit" if amt_signed < 0 else "credit"
 
         iso_date = f"{year:04d}-{month:02d}-{day:02d}"
-        desc_clean = " ".join(desc.split())
+        desc_clean = _collapse_ws(desc)
         merchant, description = _split_chase_merchant(desc_clean)
-        note = f"from {path.name}"
 
-        rows.append(
+        rows_append(
             {
                 "Date": iso_date,
                 "Amount": float(amt_signed),
@@ -1173,12 +1142,16 @@ def _parse_chase_transaction_detail(path: Path):
             }
         )
 
-    # Extra pass: Millennium Healt Direct Dep lines outside the detail block
-    payroll_re = re.compile(
-        r"(\d{2})/(\d{2})\s+Millennium Healt\s+Direct Dep\s+PPD ID:\s*\d+\s+(-?\d[\d,]*\.\d{2})\s+(-?\d[\d,]*\.\d{2})"
-    )
-
-    for m in payroll_re.finditer(txt):
+    # Extra pass: Millennium Healt Direct Dep lines outside the detail block.
+    # Payroll rows already captured, keyed by (date, amount in cents), so each
+    # extra hit is a set lookup instead of a scan over every row.
+    payroll_keys = {
+        (r["Date"], round(r["Amount"] * 100))
+        for r in rows
+        if "Millennium Healt" in r["Merchant"]
+    }
+    payroll_note = f"from {path.name} (payroll line outside detail block)"
+    for m in _CHASE_PAYROLL_RE.finditer(txt):
         mm, dd, amt_str, _bal_str = m.groups()
         month = int(mm)
         day = int(dd)
@@ -1186,21 +1159,16 @@ def _parse_chase_transaction_detail(path: Path):
         year = current_year or (end_year or start_year or _date_cls.today().year)
 
         ctx = f"Millennium Healt Direct Dep {amt_str}"
-        amt_signed = parse_signed_amount(amt_str, context=ctx)
+        amt_signed = parse_signed_float(amt_str, context=ctx)
         direction = "debit" if amt_signed < 0 else "credit"
 
         iso_date = f"{year:04d}-{month:02d}-{day:02d}"
         desc_clean = "Millennium Healt Direct Dep PPD ID: 9111111103"
-        note = f"from {path.name} (payroll line outside detail block)"
 
-        already = any(
-            r["Date"] == iso_date
-            and abs(Decimal(str(r["Amount"])) - amt_signed) < Decimal("0.005")
-            and "Millennium Healt" in r["Merchant"]
-            for r in rows
-        )
-        if already:
+        key = (iso_date, round(amt_signed * 100))
+        if key in payroll_keys:
             continue
+        payroll_keys.add(key)
 
         rows.append(
             {
@@ -1212,7 +1180,7 @@ def _parse_chase_transaction_detail(path: Path):
                 "Merchant": desc_clean,
                 "Description": desc_clean,
                 "Category": "Income:Payroll",
-                "Notes": note,
+                "Notes": payroll_note,
             }
         )
 
@@ -1292,7 +1260,7 @@ def parse_boa_statement_text(path: Path) -> list:
 
         magnitude = abs(float(amt_str.replace(",", "")))
         amount = magnitude if current_direction == "credit" else -magnitude
-        desc_clean = " ".join(desc.split())
+        desc_clean = _collapse_ws(desc)
 
         rows.append(
             {
@@ -1335,11 +1303,14 @@ def _is_paypal_credit_statement(txt: str) -> bool:
     )
 
 
+_PAYPAL_DUE_RE = re.compile(r"Payment due date\s+(\d{2})/(\d{2})/(\d{4})")
+
+
 def _extract_paypal_statement_year(txt: str):
     """
     Look for 'Payment due date MM/DD/YYYY' and return (due_year, due_month).
     """
-    m = re.search(r"Payment due date\s+(\d{2})/(\d{2})/(\d{4})", txt)
+    m = _PAYPAL_DUE_RE.search(txt)
     if not m:
         return None, None
     mm, dd, yyyy = m.groups()
@@ -1368,6 +1339,33 @@ def _paypal_txn_iso_date(mm_dd: str, statement_year: int, due_month: int) -> str
     return f"{year:04d}-{month:02d}-{day:02d}"
 
 
+# One detail row: MM/DD, reference #, description, amount.
+_PAYPAL_DETAIL_RE = re.compile(
+    r"^\s*(\d{2}/\d{2})\s+(\S+)\s+(.*\S)\s+(-?\$?\d[\d,]*\.\d{2})\s*$"
+)
+_PAYPAL_DATE_PREFIX_RE = re.compile(r"\d{2}/\d{2}")
+# Section headings, one group per section in priority order. The longer
+# "TOTAL FEES/INTEREST CHARGED THIS PERIOD" headings contain these too.
+_PAYPAL_SECTION_RE = re.compile(
+    r"(PAYMENTS)|(PURCHASES AND OTHER DEBITS)|(FEES)|(INTEREST CHARGED)",
+    re.IGNORECASE,
+)
+_PAYPAL_SECTIONS = ("payments", "purchases", "fees", "interest")
+
+
+def _paypal_section_for_line(line: str):
+    """
+    Section a PayPal statement line switches to, or None.
+
+    One case-insensitive scan; when a line names several sections the
+    earliest in _PAYPAL_SECTIONS wins, wherever it sits in the line.
+    """
+    hits = [m.lastindex for m in _PAYPAL_SECTION_RE.finditer(line)]
+    if not hits:
+        return None
+    return _PAYPAL_SECTIONS[min(hits) - 1]
+
+
 def _parse_paypal_credit_detail(path: Path):
     """
     Parse a PayPal Credit / PayPal Cashback Synchrony statement OCR text file
@@ -1399,47 +1397,23 @@ def _parse_paypal_credit_detail(path: Path):
         stmt_year = today.year
         due_month = today.month
 
-    lines = txt.splitlines()
-
-    # Find "Transaction details"
-    start_idx = None
-    for i, line in enumerate(lines):
-        if "Transaction details" in line:
-            start_idx = i
-            break
-    if start_idx is None:
+    # Find "Transaction details" and only split the text from there on;
+    # nothing above it is parsed.
+    start = txt.find("Transaction details")
+    if start < 0:
         return []
+    # One iterator shared by the header skip and the row loop below.
+    lines = iter(txt[start:].splitlines())
+    next(lines)  # the rest of the "Transaction details" line
 
     # Skip header lines until after the 'Date Reference #' row
-    idx = start_idx + 1
-    while idx < len(lines):
-        line = lines[idx].rstrip("\n")
-
-        if "Date" in lines[idx] and "Amount" in lines[idx]:
-            idx += 1
+    for line in lines:
+        if "Date" in line and "Amount" in line:
             break
 
-        idx += 1
-
     rows = []
     current_section = None  # "payments", "purchases", "fees", "interest"
 
-    detail_re = re.compile(
-        r"^\s*(\d{2}/\d{2})\s+(\S+)\s+(.*\S)\s+(-?\$?\d[\d,]*\.\d{2})\s*$"
-    )
-
-    def _update_section(line: str):
-        t = line.upper()
-        if "PAYMENTS" in t:
-            return "payments"
-        if "PURCHASES AND OTHER DEBITS" in t:
-            return "purchases"
-        if "TOTAL FEES CHARGED THIS PERIOD" in t or "FEES" in t:
-            return "fees"
-        if "TOTAL INTEREST CHARGED THIS PERIOD" in t or "INTEREST CHARGED" in t:
-            return "interest"
-        return None
-
     def _section_category(section: str, desc_upper: str) -> str:
         if section == "purchases":
             return "Spending:Purchases"
@@ -1454,7 +1428,7 @@ def _parse_paypal_credit_detail(path: Path):
         return ""
 
     def _section_direction_and_amount(section: str, raw_amount: str, desc_upper: str):
-        amt_signed = parse_signed_amount(raw_amount, context=desc_upper)
+        amt_signed = parse_signed_float(raw_amount, context=desc_upper)
 
         if section in ("purchases", "fees", "interest"):
             if amt_signed > 0:
@@ -1471,35 +1445,37 @@ def _parse_paypal_credit_detail(path: Path):
         return amt_signed, direction
 
     last_row = None
-
-    while idx < len(lines):
-        line = lines[idx].rstrip("\n")
-
+    note = f"from {path.name} (PayPal credit detail)"
+    # Bound once: these are tried on every remaining line of the statement.
+    detail_match = _PAYPAL_DETAIL_RE.match
+    date_prefix_match = _PAYPAL_DATE_PREFIX_RE.match
+    section_for_line = _paypal_section_for_line
+    rows_append = rows.append
+
+    for line in lines:
         if "Cardholder news and information" in line:
             break
 
-        sec = _update_section(line)
+        sec = section_for_line(line)
         if sec:
             current_section = sec
-            idx += 1
             continue
 
+        m = detail_match(line)
+
         # Continuation line: no date, no amount, but we had a last_row
-        if last_row is not None and not detail_re.match(line):
+        if last_row is not None and not m:
             stripped = line.strip()
-            if stripped and not re.match(r"^\d{2}/\d{2}", stripped):
+            if stripped and not date_prefix_match(stripped):
                 last_row["Description"] = f"{last_row['Description']} {stripped}"
                 last_row["Merchant"] = last_row["Description"]
-            idx += 1
             continue
 
-        m = detail_re.match(line)
         if not m:
-            idx += 1
             continue
 
         mm_dd, ref, desc, amt_str = m.groups()
-        desc_clean = " ".join(desc.split())
+        desc_clean = _collapse_ws(desc)
         desc_upper = desc_clean.upper()
         iso_date = _paypal_txn_iso_date(mm_dd, stmt_year, due_month)
 
@@ -1508,8 +1484,6 @@ def _parse_paypal_credit_detail(path: Path):
         )
         category = _section_category(current_section or "", desc_upper)
 
-        note = f"from {path.name} (PayPal credit detail)"
-
         row = {
             "Date": iso_date,
             "Amount": float(amt_signed),
@@ -1521,11 +1495,9 @@ def _parse_paypal_credit_detail(path: Path):
             "Category": category,
             "Notes": note,
         }
-        rows.append(row)
+        rows_append(row)
         last_row = row
 
-        idx += 1
-
     return rows
 
 
@@ -1541,6 +1513,35 @@ from pathlib import Path
 from ocr_import_helpers import import_ocr_rows
 
 
+def _ocr_upload(job):
+    """
+    Worker for the parallel OCR step: OCR one upload into its *_ocr.txt.
+
+    Returns (dst, error) so a failing file is reported by the parent
+    without aborting the other workers.
+    """
+    src, dst = job
+    try:
+        ocr_to_text_with_consistency(src, dst, passes=1)
+    except Exception as e:
+        return dst, e
+    return dst, None
+
+
+def _run_ocr_jobs(jobs):
+    """
+    OCR every (src, dst) pair, fanning out across threads when there is
+    more than one file. The work happens in pdftotext/tesseract
+    subprocesses, so threads overlap it without forking the Flask app and
+    its DB engine; parsing and DB inserts stay serial in the caller.
+    """
+    if len(jobs) <= 1:
+        return [_ocr_upload(job) for job in jobs]
+    workers = min(len(jobs), _ocr_os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_ocr_upload, jobs))
+
+
 def process_uploaded_statement_files(uploads_dir, statements_dir):
     """
     1) Take whatever files are sitting in `uploads_dir` (PNGs, JPGs, PDFs,
@@ -1586,6 +1587,8 @@ def process_uploaded_statement_files(uploads_dir, statements_dir):
     except Exception:
         pass
 
+    ocr_jobs = []   # (src, dst) pairs OCR'd in parallel after this loop
+
     for src in sorted(uploads_dir.iterdir()):
         if not src.is_file():
             continue
@@ -1630,21 +1633,27 @@ def process_uploaded_statement_files(uploads_dir, statements_dir):
                 print(f"[OCR] Skipping unrecognised CSV: {src.name}")
             continue
 
-        # PDF / PNG / JPG / JPEG -> run OCR
+        # PDF / PNG / JPG / JPEG -> queue for OCR; the slot in txt_paths
+        # keeps the sorted upload order for the parse step.
         if ext in {".pdf", ".png", ".jpg", ".jpeg"}:
             dst = statements_dir / f"{src.stem}_ocr.txt"
-            try:
-                # use the simplified wrapper we added earlier
-                ocr_to_text_with_consistency(src, dst, passes=1)
-                txt_paths.append(dst)
-                stats["saved_files"] += 1
-            except Exception as e:
-                print(f"[OCR] Error OCR'ing {src}: {e}")
+            ocr_jobs.append((src, dst))
+            txt_paths.append(dst)
             continue
 
         # Ignore unknown extensions
         print(f"[OCR] Skipping unsupported file type: {src}")
 
+    failed = set()
+    for (src, _dst), (dst, err) in zip(ocr_jobs, _run_ocr_jobs(ocr_jobs)):
+        if err is None:
+            stats["saved_files"] += 1
+        else:
+            print(f"[OCR] Error OCR'ing {src}: {err}")
+            failed.add(dst)
+    if failed:
+        txt_paths = [p for p in txt_paths if p not in failed]
+
     # --------------------------------------------------
     # 2) Parse *_ocr.txt -> normalized row dicts
     # --------------------------------------------------
@@ -1806,6 +1815,18 @@ def process_uploaded_statement_files(uploads_dir, statements_dir):
 
     return stats
 
+_DETAIL_START = "*start*transaction detail"
+# One detail block body. A start marker with no end before the next start
+# is unterminated; such a match carries the later start inside its body.
+_DETAIL_BLOCK_RE = re.compile(
+    r"\*start\*transaction detail(.*?)\*end\*transaction detail", re.DOTALL
+)
+# A candidate row inside a block: MM/DD, description, amount, balance.
+_TX_LINE_RE = re.compile(
+    r"^\s*(\d{2}/\d{2})\s+(.+?)\s+(-?\d[\d,]*\.\d{2})\s+(-?\d[\d,]*\.\d{2})\s*$"
+)
+
+
 def _count_candidates_in_file(path: Path) -> int:
     """
     Count 'candidate' transaction lines in a single *_ocr.txt statement:
@@ -1814,14 +1835,15 @@ def _count_candidates_in_file(path: Path) -> int:
     """
     text = path.read_text(errors="ignore")
     total = 0
+    line_match = _TX_LINE_RE.match
 
-    parts = text.split("*start*transaction detail")
-    for part in parts[1:]:
-        if "*end*transaction detail" not in part:
-            continue
-        body = part.split("*end*transaction detail", 1)[0]
+    for block in _DETAIL_BLOCK_RE.finditer(text):
+        body = block.group(1)
+        if _DETAIL_START in body:
+            # Skip past unterminated starts to the one this end closes.
+            body = body.rsplit(_DETAIL_START, 1)[1]
         for line in body.splitlines():
-            m = _TX_LINE_RE.match(line)
+            m = line_match(line)
             if not m:
                 continue
             desc = m.group(2).strip()
@@ -1920,76 +1942,79 @@ def parse_capone_date(s: str):
     return datetime.strptime(s, "%Y-%m-%d").date()
 
 
-def _parse_capone_amount(row: dict) -> Decimal:
-    """
-    Capital One CSV has separate Debit and Credit columns.
+def _capone_csv_column(chunk, name):
+    """A stripped string column, or empty strings if the export lacks it."""
+    if name not in chunk.columns:
+        return _pd.Series("", index=chunk.index)
+    return chunk[name].str.strip()
 
-    - Debit  (charges, purchases, interest) -> money out  -> NEGATIVE
-    - Credit (payments, refunds)            -> money in   -> POSITIVE
-    """
-    debit_raw = (row.get("Debit") or "").strip()
-    credit_raw = (row.get("Credit") or "").strip()
-
-    def to_dec(s: str) -> Decimal:
-        s = s.replace("$", "").replace(",", "").strip()
-        if not s:
-            return Decimal("0")
-        try:
-            return Decimal(s)
-        except InvalidOperation:
-            return Decimal("0")
-
-    debit = to_dec(debit_raw)
-    credit = to_dec(credit_raw)
 
-    # spending (debit) -> negative, payments/credits -> positive
-    return credit - debit
+def _capone_csv_money(col):
+    """Vectorized "$1,234.56" -> 1234.56; blanks and junk count as 0."""
+    cleaned = col.str.replace(r"[$,]", "", regex=True)
+    return _pd.to_numeric(cleaned, errors="coerce").fillna(0.0)
 
 
-def iter_capone_csv_rows(base_dir: Path):
+def iter_capone_csv_rows(base_dir: Path, chunksize: int = 10_000):
     """
     Yield normalized row dicts for Capital One CSV exports in:
 
         base_dir / "capone" / *.csv
+
+    Each file is read in pandas chunks and parsed column-wise:
+    - Debit  (charges, purchases, interest) -> money out  -> NEGATIVE
+    - Credit (payments, refunds)            -> money in   -> POSITIVE
+    Amounts are yielded as Decimal (cents), as before; unparseable dates
+    come out as None.
     """
     capone_dir = base_dir / "capone"
     if not capone_dir.exists():
         return  # nothing to do
 
     for csv_path in sorted(capone_dir.glob("*.csv")):
-        with csv_path.open("r", newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for raw in reader:
-                # 1) Date
-                date_str = (raw.get("Transaction Date") or "").strip()
-                tx_date = parse_capone_date(date_str)
-
-                # 2) Description / merchant
-                description = (raw.get("Description") or "").strip()
-
-                # 3) Card number -> last 4 -> account name
-                card_no = (raw.get("Card No.") or "").strip()
-                last4 = card_no[-4:] if len(card_no) >= 4 else card_no
-                account_name = f"Capital One {last4 or 'Unknown'}"
-
-                # 4) Amount (Debit/Credit -> signed)
-                amount = _parse_capone_amount(raw)
-
-                # 5) Category (optional, but nice to keep somewhere)
-                category = (raw.get("Category") or "").strip()
-
-                raw_desc = (
-                    f"{csv_path.name} | {date_str} | {description} | "
-                    f"{card_no} | {category}"
-                )
+        try:
+            chunks = _pd.read_csv(
+                csv_path,
+                dtype=str,
+                keep_default_na=False,
+                encoding="utf-8-sig",
+                chunksize=chunksize,
+            )
+        except _pd.errors.EmptyDataError:
+            continue  # 0-byte export: no header, no rows
+        for chunk in chunks:
+            date_str = _capone_csv_column(chunk, "Transaction Date")
+            description = _capone_csv_column(chunk, "Description")
+            card_no = _capone_csv_column(chunk, "Card No.")
+            category = _capone_csv_column(chunk, "Category")
+
+            parsed = _pd.to_datetime(date_str, format="%Y-%m-%d", errors="coerce")
+            dates = parsed.dt.date.astype(object).where(parsed.notna(), None)
+
+            # spending (debit) -> negative, payments/credits -> positive
+            amounts = (
+                _capone_csv_money(_capone_csv_column(chunk, "Credit"))
+                - _capone_csv_money(_capone_csv_column(chunk, "Debit"))
+            ).round(2)
+
+            last4 = card_no.str[-4:].replace("", "Unknown")
+            raw_desc = (
+                csv_path.name + " | " + date_str + " | " + description
+                + " | " + card_no + " | " + category
+            )
+            merchant = description.replace("", "Capital One transaction")
 
+            for tx_date, amount, merch, acct, raw in zip(
+                dates.tolist(), amounts.tolist(), merchant.tolist(),
+                last4.tolist(), raw_desc.tolist(),
+            ):
                 yield {
                     "date": tx_date,
-                    "amount": amount,
-                    "merchant": description or "Capital One transaction",
-                    "account_name": account_name,
+                    "amount": Decimal(f"{amount:.2f}"),
+                    "merchant": merch,
+                    "account_name": f"Capital One {acct}",
                     "source_system": "Capital One CSV",
-                    "raw_desc": raw_desc,
+                    "raw_desc": raw,
                 }
 
 def collect_all_ocr_rows(base_dir: Path = Path("ocr_output")):
@@ -2160,23 +2185,61 @@ def scan_unclaimed_amounts(source_file, full_text):
 
 
 # PREMIUM AUTO-CATEGORIZATION (added automatically)
+# Categories in priority order: the first one with any keyword in the
+# description wins.
+_CATEGORY_RULES = (
+    ("Groceries", ("FOOD4LESS","RALPHS","VONS","ALBERTSONS","TRADER JOE","WHOLEFDS","COSTCO","WALMART","TARGET","SPROUTS","SMART & FINAL")),
+    ("Dining", ("MCDONALD","STARBUCKS","CHIPOTLE","SUBWAY","IN N OUT","TACOBELL","DOORDASH","UBEREATS","GRUBHUB")),
+    ("Bills/Utilities", ("VERIZON","AT&T","T-MOBILE","SPECTRUM","COMCAST","SDGE","PG&E","SOUTHERN CALIFORNIA EDISON")),
+    ("Transportation", ("UBER","LYFT","SHELL","CHEVRON","ARCO","GAS","PARKING")),
+    ("Entertainment", ("NETFLIX","SPOTIFY","HULU","DISNEY+","YOUTUBE","APPLE.COM")),
+    ("Shopping", ("AMAZON","AMZN","TARGET.COM","BESTBUY","HOMEDEPOT")),
+    ("Health", ("CVS","WALGREENS","RITE AID","KAISER")),
+    ("Income", ("PAYROLL","DIRECT DEP","DEPOSIT","REFUND")),
+    ("Transfers", ("TRANSFER","ZELLE","VENMO","PAYPAL")),
+)
+
+try:
+    # Optional accelerator (pip install pyahocorasick), as in direction_rules.
+    import ahocorasick as _ahocorasick
+except ImportError:  # pragma: no cover - depends on the environment
+    _ahocorasick = None
+
+
+def _build_category_automaton():
+    """
+    One automaton over every category keyword, valued with the index of
+    the highest-priority category listing it, so a single pass over the
+    description finds the winning category.
+    """
+    if _ahocorasick is None:
+        return None
+    automaton = _ahocorasick.Automaton()
+    for idx in range(len(_CATEGORY_RULES) - 1, -1, -1):
+        for kw in _CATEGORY_RULES[idx][1]:
+            automaton.add_word(kw, idx)
+    automaton.make_automaton()
+    return automaton
+
+
+_CATEGORY_AUTOMATON = _build_category_automaton()
+
+
 def _guess_category(description: str) -> str:
     if not description: return "Uncategorized"
     d = description.upper()
-    rules = {
-        "Groceries": ["FOOD4LESS","RALPHS","VONS","ALBERTSONS","TRADER JOE","WHOLEFDS","COSTCO","WALMART","TARGET","SPROUTS","SMART & FINAL"],
-        "Dining": ["MCDONALD","STARBUCKS","CHIPOTLE","SUBWAY","IN N OUT","TACOBELL","DOORDASH","UBEREATS","GRUBHUB"],
-        "Bills/Utilities": ["VERIZON","AT&T","T-MOBILE","SPECTRUM","COMCAST","SDGE","PG&E","SOUTHERN CALIFORNIA EDISON"],
-        "Transportation": ["UBER","LYFT","SHELL","CHEVRON","ARCO","GAS","PARKING"],
-        "Entertainment": ["NETFLIX","SPOTIFY","HULU","DISNEY+","YOUTUBE","APPLE.COM"],
-        "Shopping": ["AMAZON","AMZN","TARGET.COM","BESTBUY","HOMEDEPOT"],
-        "Health": ["CVS","WALGREENS","RITE AID","KAISER"],
-        "Income": ["PAYROLL","DIRECT DEP","DEPOSIT","REFUND"],
-        "Transfers": ["TRANSFER","ZELLE","VENMO","PAYPAL"]
-    }
-    for cat, kw in rules.items():
-        if any(k in d for k in kw):
-            return cat
+    if _CATEGORY_AUTOMATON is not None:
+        best = None
+        for _end, idx in _CATEGORY_AUTOMATON.iter(d):
+            if best is None or idx < best:
+                best = idx
+                if idx == 0:
+                    break
+        return _CATEGORY_RULES[best][0] if best is not None else "Uncategorized"
+    for cat, kw in _CATEGORY_RULES:
+        for k in kw:
+            if k in d:
+                return cat
     return "Uncategorized"
 
 # ---- helper: safe_unlink --------------------------------------------
@@ -2292,6 +2355,7 @@ _TXN_KEYWORDS_RE = re.compile(
 )
 
 _AMOUNT_RE = re.compile(r'(-?\$[\d,]+\.\d{2})')
+_INCOME_HINT_RE = re.compile(r"\b(credit|deposit|payroll|refund)\b", re.IGNORECASE)
 
 
 def _parse_amount_with_sign(rest: str, amount_raw: str) -> float:
@@ -2314,7 +2378,7 @@ def _parse_amount_with_sign(rest: str, amount_raw: str) -> float:
         return value
 
     # Decide sign from context
-    if re.search(r"\b(credit|deposit|payroll|refund)\b", rest, re.IGNORECASE):
+    if _INCOME_HINT_RE.search(rest):
         return abs(value)  # income
     else:
         return -abs(value)  # spending
@@ -91,16 +91,23 @@ def mark_screenshot_clones():
     """Pass B: mark Screenshot OCR rows that duplicate any other source on (date, amount, merchant)."""
     print("Pass B: marking Screenshot OCR clones of other sources...")
 
-    # Build an index of (date, amount, merchant) -> has_non_screenshot flag
+    # Build an index of (date, amount, merchant) -> has_non_screenshot flag.
+    # Only the four key columns are selected and streamed in chunks, so no ORM
+    # instances are built and memory stays bounded to one chunk of tuples.
     key_to_non_screenshot = {}
 
-    all_rows = db.session.query(Transaction).all()
-    for t in all_rows:
-        if t.date is None or t.amount is None or t.merchant is None:
+    key_rows = db.session.query(
+        Transaction.date,
+        Transaction.amount,
+        Transaction.merchant,
+        Transaction.source_system,
+    ).yield_per(5000)
+    for t_date, t_amount, t_merchant, t_source in key_rows:
+        if t_date is None or t_amount is None or t_merchant is None:
             continue
-        key = (t.date, float(t.amount), t.merchant)
+        key = (t_date, float(t_amount), t_merchant)
 
-        is_screenshot = (t.source_system or "").strip().lower() == "screenshot ocr"
+        is_screenshot = (t_source or "").strip().lower() == "screenshot ocr"
         info = key_to_non_screenshot.get(key, {"has_non_screenshot": False})
 
         if not is_screenshot:
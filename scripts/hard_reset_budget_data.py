@@ -4,7 +4,8 @@ hard_reset_budget_data.py
 
 Hard reset for budget_app:
 
-- DROP and RECREATE all SQLAlchemy tables.
+- Empty all SQLAlchemy tables (TRUNCATE on Postgres, DROP and RECREATE
+  elsewhere).
 - Wipe selected artifact / temp directories under uploads/.
 
 Does NOT touch:
@@ -13,8 +14,11 @@ Does NOT touch:
 """
 
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from sqlalchemy import text
+
 from app import app, db
 
 
@@ -36,11 +40,20 @@ ARTIFACT_DIRS = [
 def wipe_dir(path: Path) -> None:
     """
     Delete a directory if it exists, then recreate it empty.
+
+    The old tree is renamed aside to <name>.deleting first, so the empty
+    dir is back in place after one rename + mkdir; the slow rmtree of the
+    renamed tree happens last.
     """
+    doomed = None
     if path.exists():
         if path.is_dir():
+            doomed = path.with_name(path.name + ".deleting")
+            if doomed.exists():
+                # Leftover from an interrupted reset.
+                shutil.rmtree(doomed, ignore_errors=True)
             print(f"  - Removing directory tree: {path}")
-            shutil.rmtree(path, ignore_errors=True)
+            path.rename(doomed)
         else:
             print(f"  - {path} exists but is not a directory; deleting file.")
             path.unlink(missing_ok=True)
@@ -48,12 +61,32 @@ def wipe_dir(path: Path) -> None:
     print(f"  - Recreating empty dir: {path}")
     path.mkdir(parents=True, exist_ok=True)
 
+    if doomed is not None:
+        shutil.rmtree(doomed, ignore_errors=True)
+
 
 def reset_database() -> None:
     """
-    Drop and recreate all SQLAlchemy tables.
+    Empty all SQLAlchemy tables.
+
+    On Postgres this is a single TRUNCATE ... RESTART IDENTITY CASCADE,
+    which keeps the schema (indexes, FKs) in place. Anywhere TRUNCATE is
+    unavailable (SQLite) we drop and recreate all tables instead.
     """
     with app.app_context():
+        if db.engine.dialect.name == "postgresql":
+            quote = db.engine.dialect.identifier_preparer.quote
+            tables = ", ".join(quote(t.name) for t in db.metadata.sorted_tables)
+            try:
+                print("Truncating all tables …")
+                db.session.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+                db.session.commit()
+                print("Database reset complete (all tables empty).")
+                return
+            except Exception as e:
+                db.session.rollback()
+                print(f"TRUNCATE failed ({e}); falling back to drop/create.")
+
         print("Dropping all tables via db.drop_all() …")
         db.drop_all()
         db.session.commit()
@@ -69,7 +102,7 @@ def main() -> None:
     print("======================================================")
     print("")
     print("This will:")
-    print("  * DROP and RECREATE all database tables.")
+    print("  * Empty all database tables.")
     print("  * Wipe selected artifact/temp directories under uploads/.")
     print("")
     print("It will NOT touch:")
@@ -85,8 +118,9 @@ def main() -> None:
     reset_database()
 
     print("\n[2/2] Cleaning artifact/temp directories …")
-    for d in ARTIFACT_DIRS:
-        wipe_dir(d)
+    # rmtree is I/O-bound and releases the GIL, so the dirs wipe in parallel.
+    with ThreadPoolExecutor(max_workers=len(ARTIFACT_DIRS)) as ex:
+        list(ex.map(wipe_dir, ARTIFACT_DIRS))
 
     print("\nAll done!")
     print("- Fresh empty DB")
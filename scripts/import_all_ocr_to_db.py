@@ -13,6 +13,9 @@ This bypasses the frontend upload flow and gives us a clean
 from pathlib import Path
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+
+from sqlalchemy import insert, select
 
 from app import app, db, Transaction
 from ocr_pipeline import process_statement_files
@@ -21,6 +24,36 @@ from ocr_pipeline import process_statement_files
 BASE_DIR = Path(__file__).resolve().parent
 STATEMENTS_DIR = BASE_DIR / "uploads" / "statements"
 
+# Accepted field names per Transaction column, in priority order.
+_DATE_KEYS = ("Date", "date", "txn_date", "posted_date")
+_AMOUNT_KEYS = ("Amount", "amount", "signed_amount", "value")
+_DIRECTION_KEYS = ("Direction", "direction")
+_MERCHANT_KEYS = ("Merchant", "merchant", "payee")
+_DESCRIPTION_KEYS = ("Description", "description", "memo")
+_CATEGORY_KEYS = ("Category", "category")
+_ACCOUNT_KEYS = ("Account", "account", "account_name")
+_SOURCE_KEYS = ("Source", "source", "source_system")
+_NOTES_KEYS = ("Notes", "notes")
+
+# Bare bank abbreviations accepted alongside "debit..." / "credit...".
+_DIRECTION_ABBREVIATIONS = {"dr": -1, "cr": 1}
+
+
+@lru_cache(maxsize=64)
+def _direction_sign(direction):
+    """
+    -1 for debits, +1 for credits, None if the direction is unrecognised.
+
+    Parsers emit a handful of distinct direction strings, so the cache
+    turns this into one dict lookup per row.
+    """
+    dir_l = direction.strip().lower()
+    if dir_l.startswith("debit"):
+        return -1
+    if dir_l.startswith("credit"):
+        return 1
+    return _DIRECTION_ABBREVIATIONS.get(dir_l)
+
 
 def _row_to_kwargs(row):
     """
@@ -43,22 +76,23 @@ def _row_to_kwargs(row):
     }
     """
 
-    # Helper to pull values from dict or attributes
+    # Pick the accessor once per row instead of re-checking the row type
+    # for every field lookup.
+    if isinstance(row, dict):
+        lookup = row.get
+    else:
+        def lookup(name):
+            return getattr(row, name, None)
+
     def get_any(names, default=None):
-        if isinstance(row, dict):
-            for name in names:
-                if name in row and row[name] not in (None, ""):
-                    return row[name]
-        else:
-            for name in names:
-                if hasattr(row, name):
-                    val = getattr(row, name)
-                    if val not in (None, ""):
-                        return val
+        for name in names:
+            val = lookup(name)
+            if val is not None and val != "":
+                return val
         return default
 
     # --- Date ---
-    dt = get_any(["Date", "date", "txn_date", "posted_date"])
+    dt = get_any(_DATE_KEYS)
     if isinstance(dt, datetime):
         dt = dt.date()
     elif isinstance(dt, str):
@@ -75,20 +109,23 @@ def _row_to_kwargs(row):
         dt = None
 
     # --- Raw Amount + Direction ---
-    amt = get_any(["Amount", "amount", "signed_amount", "value"])
-    direction = get_any(["Direction", "direction"])
+    amt = get_any(_AMOUNT_KEYS)
+    direction = get_any(_DIRECTION_KEYS)
 
-    # Normalize amount to Decimal
+    # Normalize amount to Decimal.  Strings are parsed directly and ints
+    # are exact; only floats go through str(), which gives the shortest
+    # decimal that round-trips (Decimal(float) would keep the binary noise).
     if isinstance(amt, str):
-        amt_str = amt.replace(",", "").strip()
         try:
-            amt = Decimal(amt_str)
+            amt = Decimal(amt.replace(",", "").strip())
         except InvalidOperation:
             amt = None
-    elif isinstance(amt, (int, float)):
-        amt = Decimal(str(amt))
     elif isinstance(amt, Decimal):
         pass
+    elif isinstance(amt, int):
+        amt = Decimal(amt)
+    elif isinstance(amt, float):
+        amt = Decimal(str(amt))
     else:
         amt = None
 
@@ -96,21 +133,20 @@ def _row_to_kwargs(row):
     signed_amount = None
     if amt is not None:
         signed_amount = amt
-        if direction:
-            dir_l = str(direction).strip().lower()
-            if dir_l.startswith("debit") and amt > 0:
-                signed_amount = -amt
-            elif dir_l.startswith("credit") and amt < 0:
-                # If somehow already negative for a credit, flip
-                signed_amount = -amt
+        sign = _direction_sign(str(direction)) if direction else None
+        if sign == -1 and amt > 0:
+            signed_amount = -amt
+        elif sign == 1 and amt < 0:
+            # If somehow already negative for a credit, flip
+            signed_amount = -amt
 
     # --- Text fields ---
-    merchant = get_any(["Merchant", "merchant", "payee"], default="")
-    description = get_any(["Description", "description", "memo"], default="")
-    category = get_any(["Category", "category"], default="")
-    account_name = get_any(["Account", "account", "account_name"], default="")
-    source_system = get_any(["Source", "source", "source_system"], default="Statement OCR")
-    notes = get_any(["Notes", "notes"], default="")
+    merchant = get_any(_MERCHANT_KEYS, default="")
+    description = get_any(_DESCRIPTION_KEYS, default="")
+    category = get_any(_CATEGORY_KEYS, default="")
+    account_name = get_any(_ACCOUNT_KEYS, default="")
+    source_system = get_any(_SOURCE_KEYS, default="Statement OCR")
+    notes = get_any(_NOTES_KEYS, default="")
 
     # Minimal validity check: require date and amount
     if dt is None or signed_amount is None:
@@ -130,7 +166,8 @@ def _row_to_kwargs(row):
 
 def main():
     # Discover all *_ocr.txt files
-    ocr_files = sorted(STATEMENTS_DIR.glob("*_ocr.txt"))
+    # Files are parsed independently, so no need to sort them.
+    ocr_files = list(STATEMENTS_DIR.glob("*_ocr.txt"))
     print(f"[info] Found {len(ocr_files)} *_ocr.txt files in {STATEMENTS_DIR}")
     if not ocr_files:
         return
@@ -140,42 +177,59 @@ def main():
     print(f"[info] Calling process_statement_files(...) on all OCR files…")
     print(f"[info] Parser returned {len(rows)} row(s).")
 
-    inserted = 0
+    # Rows to insert, collected up front and written with one executemany.
+    mappings = []
     skipped = 0
 
     with app.app_context():
         before = db.session.query(Transaction).count()
         print(f"[info] Transactions BEFORE import: {before}")
 
+        # Simple duplicate check on
+        # (date, amount, merchant, description, account_name, source_system):
+        # load every existing key once instead of one SELECT per parsed row.
+        # Amounts are compared as floats, which is how the column stores them.
+        existing = set(
+            map(
+                tuple,
+                db.session.execute(
+                    select(
+                        Transaction.date,
+                        Transaction.amount,
+                        Transaction.merchant,
+                        Transaction.description,
+                        Transaction.account_name,
+                        Transaction.source_system,
+                    )
+                ),
+            )
+        )
+
         for row in rows:
             kwargs = _row_to_kwargs(row)
             if not kwargs:
                 skipped += 1
                 continue
 
-            # Simple duplicate check:
-            # Use date, amount, merchant, description, account_name, source_system
-            exists = (
-                db.session.query(Transaction.id)
-                .filter_by(
-                    date=kwargs["date"],
-                    amount=kwargs["amount"],
-                    merchant=kwargs["merchant"],
-                    description=kwargs["description"],
-                    account_name=kwargs["account_name"],
-                    source_system=kwargs["source_system"],
-                )
-                .first()
+            key = (
+                kwargs["date"],
+                float(kwargs["amount"]),
+                kwargs["merchant"],
+                kwargs["description"],
+                kwargs["account_name"],
+                kwargs["source_system"],
             )
-            if exists:
+            if key in existing:
                 skipped += 1
                 continue
 
-            tx = Transaction(**kwargs)
-            db.session.add(tx)
-            inserted += 1
+            existing.add(key)
+            mappings.append(kwargs)
 
+        if mappings:
+            db.session.execute(insert(Transaction), mappings)
         db.session.commit()
+        inserted = len(mappings)
         after = db.session.query(Transaction).count()
 
     print(f"[info] Inserted: {inserted} row(s), skipped: {skipped} row(s).")
@@ -11,6 +11,7 @@ Bulk-import ALL PDF statements exactly like the Flask upload flow:
 """
 
 from pathlib import Path
+import os
 import shutil
 import tempfile
 
@@ -23,24 +24,39 @@ STATEMENTS_DIR = BASE_DIR / "uploads" / "statements"
 PDF_DIR = STATEMENTS_DIR   # PDFs are already stored here
 
 
-def main():
-    # 1) Find all PDF files
-    pdf_paths = sorted(PDF_DIR.glob("*.pdf"))
-    print(f"[info] Found {len(pdf_paths)} PDFs in {PDF_DIR}")
-    if not pdf_paths:
-        print("[warn] No PDFs found.")
-        return
+def _link_or_copy(src: Path, dest: Path) -> None:
+    """
+    Hard-link src to dest, falling back to a kernel-side copy.
+
+    The temp uploads folder is only read by the pipeline, so a link is
+    enough and moves no bytes; across filesystems (e.g. /tmp on tmpfs)
+    os.link fails and shutil.copyfile uses sendfile/copy_file_range.
+    """
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
 
-    # 2) Create a temporary uploads directory
+
+def main():
+    # 1) Create a temporary uploads directory
     temp_uploads = Path(tempfile.mkdtemp(prefix="pdf_import_"))
     print(f"[info] Temporary uploads dir: {temp_uploads}")
 
-    # 3) Copy PDFs into uploads_dir
-    for pdf in pdf_paths:
-        shutil.copy2(pdf, temp_uploads / pdf.name)
-    print(f"[info] Copied {len(pdf_paths)} PDFs into temp uploads folder.")
+    # 2) Stage PDFs into uploads_dir as the directory is listed.  No sort:
+    # the pipeline orders the uploads dir itself.
+    staged = 0
+    for pdf in PDF_DIR.iterdir():
+        if pdf.suffix.lower() == ".pdf" and pdf.is_file():
+            _link_or_copy(pdf, temp_uploads / pdf.name)
+            staged += 1
+    print(f"[info] Staged {staged} PDFs from {PDF_DIR} into temp uploads folder.")
+    if not staged:
+        print("[warn] No PDFs found.")
+        shutil.rmtree(temp_uploads, ignore_errors=True)
+        return
 
-    # 4) Run the *real* upload pipeline
+    # 3) Run the *real* upload pipeline
     print("[info] Running process_uploaded_statement_files()...")
     with app.app_context():
         result = process_uploaded_statement_files(
@@ -55,7 +71,7 @@ def main():
         print("[info] Pipeline result:")
         print(result)
 
-    # 5) Cleanup temp folder
+    # 4) Cleanup temp folder
     try:
         shutil.rmtree(temp_uploads)
         print("[info] Cleaned up temp upload directory.")
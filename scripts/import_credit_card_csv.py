@@ -3,7 +3,9 @@
 Generic importer for credit card / debt statement CSVs.
 
 This script converts a CSV into Transaction rows using your existing
-Transaction.from_dict() convention:
+Transaction.from_dict() convention (rows are mapped with
+Transaction.values_from_dict(), the same mapping from_dict() uses, and
+written in one bulk insert):
 
     {
         "Date":        <date or string>,
@@ -57,10 +59,9 @@ By default the script:
 """
 
 import argparse
-import csv
-from datetime import datetime
 
-from sqlalchemy import and_
+import pandas as pd
+from sqlalchemy import insert, select
 
 from app import app, db, Transaction
 
@@ -137,10 +138,6 @@ def parse_args():
     return p.parse_args()
 
 
-def normalize_str(x):
-    return (x or "").strip()
-
-
 def infer_direction_from_sign(amount):
     # You can invert this if you prefer the opposite convention
     if amount > 0:
@@ -152,31 +149,26 @@ def infer_direction_from_sign(amount):
         return "debit"
 
 
-def infer_direction_from_column(raw_value, debit_set, credit_set):
-    if raw_value is None:
-        return None
-    s = normalize_str(raw_value).upper()
-    if s in debit_set:
-        return "debit"
-    if s in credit_set:
-        return "credit"
-    return None
-
-
-def row_exists(date_obj, amount, merchant, account, source):
-    """Check if a non-transfer row with this signature already exists."""
-    q = (
-        db.session.query(Transaction)
-        .filter(
-            Transaction.date == date_obj,
-            Transaction.amount == amount,
-            Transaction.merchant == merchant,
+def load_existing_keys(account, source):
+    """
+    (date, amount, merchant) of every non-transfer row already imported for
+    this account/source, loaded in one query for set-based duplicate checks.
+    """
+    rows = db.session.execute(
+        select(Transaction.date, Transaction.amount, Transaction.merchant).where(
             Transaction.account_name == account,
             Transaction.source_system == source,
             Transaction.is_transfer.is_(False),
         )
     )
-    return db.session.query(q.exists()).scalar()
+    return set(map(tuple, rows))
+
+
+def _str_column(df, name):
+    """Stripped string column, or all-empty if the CSV has no such column."""
+    if name is None or name not in df.columns:
+        return pd.Series("", index=df.index)
+    return df[name].str.strip()
 
 
 def main():
@@ -184,85 +176,107 @@ def main():
 
     debit_values = {s.strip().upper() for s in args.debit_values.split(",") if s.strip()}
     credit_values = {s.strip().upper() for s in args.credit_values.split(",") if s.strip()}
+    # One lookup per type value; debit wins if a value is listed in both.
+    direction_by_type = {v: "credit" for v in credit_values}
+    direction_by_type.update({v: "debit" for v in debit_values})
+
+    # Parse the whole CSV column-wise.  Everything is read as text (no NaN
+    # for blanks) so parsing and validation match the old per-row rules.
+    # Only the columns named on the command line are materialised; wide
+    # bank exports carry many more that would otherwise be copied per row.
+    wanted = {
+        args.date_col, args.amount_col, args.merchant_col,
+        args.desc_col, args.direction_col, args.notes_col,
+    }
+    df = pd.read_csv(
+        args.csv,
+        dtype=str,
+        keep_default_na=False,
+        encoding="utf-8-sig",
+        usecols=lambda name: name in wanted,
+    )
+    total = len(df)
+
+    # Basic safety: require date & amount to parse
+    raw_date = _str_column(df, args.date_col)
+    raw_amount = _str_column(df, args.amount_col)
+    # cache=True parses each distinct date string once; statements repeat
+    # the same few dozen dates across hundreds of rows.
+    dates = pd.to_datetime(raw_date, format=args.date_format, errors="coerce", cache=True)
+    amounts = pd.to_numeric(raw_amount.str.replace(",", "", regex=False), errors="coerce")
+
+    valid = dates.notna() & amounts.notna()
+    has_notes_col = args.notes_col in df.columns
+    skipped_invalid = int((~valid).sum())
+
+    df = pd.DataFrame(
+        {
+            "date": dates[valid].dt.date,
+            "amount": amounts[valid].astype(float),
+            "merchant": _str_column(df, args.merchant_col)[valid],
+            "description": _str_column(df, args.desc_col)[valid],
+            "type": _str_column(df, args.direction_col)[valid],
+            "notes": _str_column(df, args.notes_col)[valid],
+        }
+    )
 
-    total = 0
-    imported = 0
-    skipped_existing = 0
-    skipped_invalid = 0
+    # Direction
+    by_sign = df["amount"].map(infer_direction_from_sign)
+    if args.direction_mode == "sign":
+        df["direction"] = by_sign
+    else:
+        # Type columns hold a handful of distinct values; normalise each
+        # once instead of upper-casing every row.
+        by_value = {v: direction_by_type.get(v.upper()) for v in df["type"].unique()}
+        by_column = df["type"].map(by_value)
+        # Fallback if we couldn't map it:
+        df["direction"] = by_column.fillna(by_sign)
+
+    # Notes: "<prefix> <notes col>", decided once for the whole column.
+    prefix = args.prefix_notes.strip() if args.prefix_notes else ""
+    if prefix:
+        if has_notes_col:
+            df["notes"] = (prefix + " " + df["notes"]).str.rstrip()
+        else:
+            df["notes"] = prefix
 
     with app.app_context():
-        with open(args.csv, "r", newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                total += 1
-
-                # Basic safety: require date & amount feel non-empty
-                raw_date = normalize_str(row.get(args.date-col))
-                raw_amount = normalize_str(row.get(args.amount-col))
-
-                if not raw_date or not raw_amount:
-                    skipped_invalid += 1
-                    continue
-
-                try:
-                    date_obj = datetime.strptime(raw_date, args.date-format).date()
-                except Exception:
-                    skipped_invalid += 1
-                    continue
-
-                try:
-                    amount = float(raw_amount.replace(",", ""))
-                except Exception:
-                    skipped_invalid += 1
-                    continue
-
-                merchant = normalize_str(row.get(args.merchant-col))
-                desc = normalize_str(row.get(args.desc-col))
-
-                # Direction
-                if args.direction-mode == "sign":
-                    direction = infer_direction_from_sign(amount)
-                else:
-                    raw_dir = row.get(args.direction-col)
-                    direction = infer_direction_from_column(raw_dir, debit_values, credit_values)
-                    # Fallback if we couldn't map it:
-                    if direction is None:
-                        direction = infer_direction_from_sign(amount)
-
-                # Notes
-                notes_parts = []
-                if args.prefix-notes:
-                    notes_parts.append(args.prefix-notes.strip())
-                if args.notes-col:
-                    extra = normalize_str(row.get(args.notes-col))
-                    if extra:
-                        notes_parts.append(extra)
-                notes = " ".join(notes_parts)
-
-                # Skip if already present
-                if args.skip-existing and row_exists(date_obj, amount, merchant, args.account, args.source):
-                    skipped_existing += 1
-                    continue
-
-                # Build dict in the format Transaction.from_dict expects
-                data = {
-                    "Date": date_obj,
+        # Skip rows already present, and repeats of the same row in this CSV
+        # (the old per-row check saw earlier rows once they were autoflushed).
+        skipped_existing = 0
+        if args.skip_existing:
+            keys = list(zip(df["date"], df["amount"], df["merchant"]))
+            existing = load_existing_keys(args.account, args.source)
+            keep = []
+            for key in keys:
+                keep.append(key not in existing)
+                existing.add(key)
+            keep = pd.Series(keep, index=df.index, dtype=bool)
+            skipped_existing = int((~keep).sum())
+            df = df[keep]
+
+        records = [
+            Transaction.values_from_dict(
+                {
+                    "Date": r.date,
                     "Source": args.source,
                     "Account": args.account,
-                    "Direction": direction,
-                    "Amount": amount,
-                    "Merchant": merchant,
-                    "Description": desc,
+                    "Direction": r.direction,
+                    "Amount": r.amount,
+                    "Merchant": r.merchant,
+                    "Description": r.description,
                     "Category": "",
-                    "Notes": notes,
+                    "Notes": r.notes,
                 }
-
-                tx = Transaction.from_dict(data)
-                db.session.add(tx)
-                imported += 1
-
+            )
+            for r in df.itertuples(index=False)
+        ]
+        if records:
+            db.session.execute(insert(Transaction), records)
         db.session.commit()
 
+    imported = len(records)
+
     print("Import complete.")
     print(f"  Total CSV rows seen:     {total}")
     print(f"  Imported new rows:       {imported}")
@@ -4,20 +4,24 @@ import_everything_from_downloads.py – FINAL VERSION
 Works with your current app.py (no Flask factory)
 """
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import shutil
 import tempfile
 import hashlib
 from datetime import datetime
 
+from sqlalchemy import func, insert, select, text, update
+
 # Add project root so imports work
 PROJECT_ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 # Your app.py creates the Flask app instance called "app" and the db object
 from app import app, db
-from models import Transaction
+from models import Transaction, FileChecksum
 from app import is_duplicate_transaction
 from ocr_pipeline import process_uploaded_statement_files
 
@@ -39,20 +43,124 @@ def get_sha256(path: Path) -> str:
     return h.hexdigest()
 
 
-def load_existing_checksums(statements_dir: Path) -> set:
-    chk_file = statements_dir / "checksums_all.txt"
-    if not chk_file.exists():
-        return set()
-    return {line.split()[0] for line in chk_file.read_text().splitlines() if line.strip()}
-
-
-def append_checksum(statements_dir: Path, path: Path, checksum: str):
-    with open(statements_dir / "checksums_all.txt", "a") as f:
-        f.write(f"{checksum}  {path.name}\n")
+def stat_key(path: Path) -> tuple:
+    """
+    (filename, size, mtime_ns) fingerprint used to skip hashing unchanged
+    files.  The name is part of the key so a different file that happens to
+    share size and mtime (same archive, cp -p / rsync -a) is still hashed.
+    """
+    st = path.stat()
+    return path.name, st.st_size, st.st_mtime_ns
+
+
+def load_existing_checksums(statements_dir: Path) -> tuple[set, set]:
+    """
+    Return (checksums, stat keys) of every file imported so far.
+
+    They live in the file_checksums table.  A legacy checksums_all.txt
+    ledger, if present, is copied into the table once and renamed.
+    """
+    legacy = statements_dir / "checksums_all.txt"
+    if legacy.exists():
+        known = set(db.session.execute(select(FileChecksum.sha256)).scalars())
+        rows = {}
+        with legacy.open() as f:
+            for line in f:
+                parts = line.split(maxsplit=1)
+                if parts and parts[0] not in known:
+                    name = parts[1].strip() if len(parts) > 1 else None
+                    rows[parts[0]] = {"sha256": parts[0], "filename": name}
+        if rows:
+            db.session.execute(insert(FileChecksum), list(rows.values()))
+        db.session.commit()
+        legacy.rename(legacy.with_name(legacy.name + ".imported"))
+        print(f"[INFO] Moved {len(rows)} checksums from {legacy.name} into the database")
+
+    rows = db.session.execute(
+        select(
+            FileChecksum.sha256, FileChecksum.filename,
+            FileChecksum.size, FileChecksum.mtime_ns,
+        )
+    ).all()
+    checksums = {r.sha256 for r in rows}
+    stat_keys = {
+        (r.filename, r.size, r.mtime_ns) for r in rows if r.size is not None
+    }
+    return checksums, stat_keys
+
+
+def _checksum_mappings(checksums: dict) -> list:
+    """{sha256: (path, stat_key)} as file_checksums row dicts."""
+    return [
+        {"sha256": c, "filename": p.name, "size": st[1], "mtime_ns": st[2]}
+        for c, (p, st) in checksums.items()
+    ]
+
+
+def record_checksums(new_checksums: dict, seen_checksums: dict):
+    """
+    Insert {sha256: (path, stat_key)} for new files, and store the current
+    stat key on already-known checksums that were hashed again (rows from
+    the legacy ledger have none), so the next run can skip them unhashed.
+    """
+    if new_checksums:
+        db.session.execute(insert(FileChecksum), _checksum_mappings(new_checksums))
+    if seen_checksums:
+        db.session.execute(update(FileChecksum), _checksum_mappings(seen_checksums))
+    db.session.commit()
+
+
+def count_transactions() -> int:
+    """
+    Row count of the transaction table, for the summary banner.
+
+    Postgres answers from the planner's pg_class estimate instead of a
+    full COUNT(*) scan; other backends count exactly.
+    """
+    if db.engine.dialect.name == "postgresql":
+        estimate = db.session.execute(
+            text("SELECT reltuples::BIGINT FROM pg_class WHERE relname = :t"),
+            {"t": Transaction.__tablename__},
+        ).scalar()
+        if estimate is not None and estimate >= 0:
+            return estimate
+    return db.session.execute(select(func.count(Transaction.id))).scalar()
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    """Hard-link into the temp uploads dir; plain copy across filesystems."""
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+def walk_pdfs(root: Path):
+    """
+    Yield the path of every *.pdf file under root.
+
+    os.scandir hands back each entry's type from the directory listing, so
+    unlike Path.rglob this needs no stat() or Path object per entry.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".pdf") and entry.is_file():
+                    yield entry.path
 
 
 # ———————— Main ————————
 def main():
+    # One app context for the whole run: the checksum ledger, the Venmo
+    # parser and the OCR pipeline all share the same session.
+    with app.app_context():
+        run_import()
+
+
+def run_import():
     accounts_root = Path.home() / "Downloads" / "accounts"
     if not accounts_root.exists():
         print(f"[ERROR] {accounts_root} not found")
@@ -61,24 +169,38 @@ def main():
     statements_dir = PROJECT_ROOT / "uploads" / "statements"
     statements_dir.mkdir(parents=True, exist_ok=True)
 
-    existing_checksums = load_existing_checksums(statements_dir)
+    existing_checksums, known_stats = load_existing_checksums(statements_dir)
 
     with tempfile.TemporaryDirectory(prefix="budget_import_") as tmp:
         temp_uploads = Path(tmp)
         copied_pdfs = 0
         venmo_added = 0
-
-        # 1. PDFs
-        for pdf_path in sorted(accounts_root.rglob("*.pdf")):
-            if pdf_path.name.endswith((".tar", ".csv")):
-                continue
-            checksum = get_sha256(pdf_path)
+        new_checksums = {}
+        seen_checksums = {}   # already imported, but hashed this run
+
+        # 1. PDFs, in directory order (the pipeline sorts its uploads dir).
+        # Files whose (name, size, mtime) matches an imported file are skipped
+        # without reading them.  hashlib releases the GIL, so the
+        # rest are checksummed on a thread pool; copying and checksum
+        # bookkeeping stay serial.
+        pdf_paths = []
+        pdf_stats = []
+        for p in map(Path, walk_pdfs(accounts_root)):
+            st = stat_key(p)
+            if st not in known_stats:
+                pdf_paths.append(p)
+                pdf_stats.append(st)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            pdf_checksums = list(pool.map(get_sha256, pdf_paths))
+
+        for pdf_path, st, checksum in zip(pdf_paths, pdf_stats, pdf_checksums):
             if checksum in existing_checksums:
+                seen_checksums[checksum] = (pdf_path, st)
                 continue
             dest = temp_uploads / f"{pdf_path.parent.name}__{pdf_path.name}"
-            shutil.copy2(pdf_path, dest)
+            _link_or_copy(pdf_path, dest)
             copied_pdfs += 1
-            append_checksum(statements_dir, pdf_path, checksum)
+            new_checksums[checksum] = (pdf_path, st)
 
         print(f"[INFO] Copied {copied_pdfs} new PDFs")
 
@@ -86,36 +208,43 @@ def main():
         venmo_dir = accounts_root / "venmo"
         if venmo_dir.exists():
             for csv_path in sorted(venmo_dir.glob("*.csv")):
+                st = stat_key(csv_path)
+                if st in known_stats:
+                    continue
                 checksum = get_sha256(csv_path)
                 if checksum in existing_checksums:
+                    seen_checksums[checksum] = (csv_path, st)
                     continue
                 print(f"[INFO] Importing Venmo CSV: {csv_path.name}")
                 count = parse_venmo_csv_file(csv_path, db.session)
                 venmo_added += count
-                append_checksum(statements_dir, csv_path, checksum)
+                new_checksums[checksum] = (csv_path, st)
+
+        record_checksums(new_checksums, seen_checksums)
 
-        # 3. Run OCR + normal pipeline inside Flask context
+        # 3. Run OCR + normal pipeline
         if copied_pdfs or venmo_added:
-            with app.app_context():          # ← this is the correct way for your app.py
-                if copied_pdfs:
-                    print(f"[INFO] Running OCR + parsers on {copied_pdfs} PDFs...")
-                    result = process_uploaded_statement_files(
-                        uploads_dir=temp_uploads,
-                        statements_dir=statements_dir,
-                        db_session=db.session,
-                        Transaction=Transaction,
-                        is_duplicate_transaction=is_duplicate_transaction,
-                    )
-                    print(f"[INFO] OCR pipeline finished: {result}")
-
-                # Final count
-                total = Transaction.query.count()
-                print("\n" + "="*60)
-                print(f"IMPORT SUCCESSFUL — {datetime.now():%Y-%m-%d %H:%M}")
-                print(f"   New PDFs processed   : {copied_pdfs}")
-                print(f"   Venmo transactions   : {venmo_added}")
-                print(f"   TOTAL IN DATABASE    : {total}")
-                print("="*60)
+            # Counted once up front (Venmo rows included); the pipeline's
+            # own insert count is added afterwards rather than re-counting.
+            total = count_transactions()
+            if copied_pdfs:
+                print(f"[INFO] Running OCR + parsers on {copied_pdfs} PDFs...")
+                result = process_uploaded_statement_files(
+                    uploads_dir=temp_uploads,
+                    statements_dir=statements_dir,
+                    db_session=db.session,
+                    Transaction=Transaction,
+                    is_duplicate_transaction=is_duplicate_transaction,
+                )
+                print(f"[INFO] OCR pipeline finished: {result}")
+                total += result.get("added_transactions", 0)
+
+            print("\n" + "="*60)
+            print(f"IMPORT SUCCESSFUL — {datetime.now():%Y-%m-%d %H:%M}")
+            print(f"   New PDFs processed   : {copied_pdfs}")
+            print(f"   Venmo transactions   : {venmo_added}")
+            print(f"   TOTAL IN DATABASE    : {total}")
+            print("="*60)
         else:
             print("[INFO] Nothing new to import — everything already processed!")
 
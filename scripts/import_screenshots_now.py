@@ -1,75 +1,198 @@
 #!/usr/bin/env python3
-from app import app, db
-from models import Transaction
+from app import app
+from ocr_import_helpers import import_ocr_rows
 from pathlib import Path
 from PIL import Image
 import pytesseract
+from concurrent.futures import ThreadPoolExecutor
+import os
 import re
+import tempfile
 from datetime import datetime
+from functools import partial
+
+try:
+    # Optional (pip install tesserocr): binds libtesseract in-process, so a
+    # worker loads the model once and reuses it for every image.  Without
+    # it we shell out to the tesseract binary via pytesseract.
+    from tesserocr import PSM, PyTessBaseAPI
+except ImportError:  # pragma: no cover - depends on the environment
+    PyTessBaseAPI = None
+
+# Chase screenshots are dark text on a light page laid out as uniform rows:
+# binarize them up front and tell tesseract to read one block of text
+# (--psm 6) so it skips its own thresholding and page-layout analysis.
+_BINARY_THRESHOLD = 128
+_TESSERACT_CONFIG = "--psm 6"
+
+# Chase browser view screenshots come from the checking account; the name
+# matches the seeded Account so import_ocr_rows can set account_id.
+_SCREENSHOT_SOURCE = "Chase (screenshot)"
+_SCREENSHOT_ACCOUNT = "Chase Checking"
+
+# Very permissive regex for Chase browser view ("$" optional on the amount).
+_CHASE_LINE_RE = re.compile(r'(\d{1,2}/\d{1,2})\s+(.+?)\s+(-?\$?[\d,]+\.\d{2})$')
+
+# Amount cleanup in one pass: drop "$" and ",", turn "(12.34)" into "-12.34".
+_AMT_TRANS = str.maketrans({'$': None, ',': None, '(': '-', ')': None})
+
+
+def parse_screenshot_text(text, cur_year=None, cur_month=None):
+    """
+    Turn the OCR text of one Chase screenshot into import_ocr_rows dicts.
+
+    Screenshot dates carry no year; they are resolved against cur_year /
+    cur_month (default: now), which callers read once per run.
+    """
+    if cur_year is None or cur_month is None:
+        now = datetime.now()
+        cur_year, cur_month = now.year, now.month
+    records = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+
+        m = _CHASE_LINE_RE.search(line)
+
+        if m:
+            date_str, merchant, amt_str = m.groups()
+            try:
+                # Clean amount
+                clean_amt = amt_str.translate(_AMT_TRANS)
+                amount = float(clean_amt)
+                if amount > 0:  # Chase shows expenses as positive
+                    amount = -amount
+
+                # Parse date
+                month, day = map(int, date_str.split('/'))
+                year = cur_year
+                if month == 12 and cur_month == 1:
+                    year -= 1
+                tx_date = datetime(year, month, day).date()
+
+                records.append({
+                    "Date": tx_date,
+                    "Amount": amount,
+                    "Merchant": merchant.strip(),
+                    "Source": _SCREENSHOT_SOURCE,
+                    "Account": _SCREENSHOT_ACCOUNT,
+                    "Direction": "debit" if amount < 0 else "credit",
+                    "Category": "Uncategorized",
+                })
+            except:
+                continue
+    return records
+
+
+def preprocess_screenshot(img_path):
+    """Grayscale + fixed threshold, as a black-and-white PIL image."""
+    gray = Image.open(img_path).convert("L")
+    return gray.point(lambda v: 255 if v > _BINARY_THRESHOLD else 0, mode="1")
+
+
+def _save_for_tesseract(image, dest_dir, name):
+    """
+    Write a preprocessed image where the tesseract binary can read it.
+
+    Bilevel images go out as PBM: a raw bitmap with no compression to run
+    here or to undo in leptonica, unlike the PNG pytesseract would write.
+    """
+    path = Path(dest_dir) / f"{name}.pbm"
+    image.save(path)
+    return str(path)
+
+
+def ocr_one(img_path, cur_year=None, cur_month=None):
+    """OCR a single screenshot."""
+    with tempfile.TemporaryDirectory(prefix="screenshot_ocr_") as tmp:
+        path = _save_for_tesseract(preprocess_screenshot(img_path), tmp, "page")
+        text = pytesseract.image_to_string(path, config=_TESSERACT_CONFIG)
+    return parse_screenshot_text(text, cur_year, cur_month)
+
+
+def ocr_batch(img_paths, cur_year=None, cur_month=None):
+    """
+    OCR a batch of screenshots with one tesseract run; runs in a worker.
+
+    With tesserocr, one API handle is opened for the batch.  Otherwise the
+    preprocessed images are written to a temp dir and tesseract is given a
+    text file listing them; it emits their text separated by form feeds, so
+    the engine and language model still load once per batch instead of once
+    per image.  If the page count does not line up we fall back to one call
+    per image.
+    """
+    if PyTessBaseAPI is not None:
+        with PyTessBaseAPI(psm=PSM.SINGLE_BLOCK) as api:
+            texts = []
+            for p in img_paths:
+                api.SetImage(preprocess_screenshot(p))
+                texts.append(api.GetUTF8Text())
+        return [parse_screenshot_text(text, cur_year, cur_month) for text in texts]
+
+    with tempfile.TemporaryDirectory(prefix="screenshot_ocr_") as tmp:
+        names = [
+            _save_for_tesseract(preprocess_screenshot(p), tmp, f"{i:05d}")
+            for i, p in enumerate(img_paths)
+        ]
+        list_path = Path(tmp) / "images.txt"
+        list_path.write_text("\n".join(names) + "\n")
+        pages = pytesseract.image_to_string(
+            str(list_path), config=_TESSERACT_CONFIG
+        ).split("\f")
+    if pages and not pages[-1].strip():
+        pages.pop()   # text after the final separator
+    if len(pages) != len(img_paths):
+        return [ocr_one(p, cur_year, cur_month) for p in img_paths]
+    return [parse_screenshot_text(text, cur_year, cur_month) for text in pages]
+
 
 def import_chase_screenshots():
     screenshot_dir = Path("uploads/screenshots")
-    if not screenshot_dir.exists() or not any(screenshot_dir.glob("*.png")):
+    # One directory listing; glob on a missing dir just yields nothing.
+    files = sorted(screenshot_dir.glob("*.png"))
+    if not files:
         print("No screenshots found in uploads/screenshots/")
         return
 
-    files = sorted(screenshot_dir.glob("*.png"))
     print(f"Found {len(files)} Chase screenshots — importing now...\n")
 
-    total = 0
-    with app.app_context():
-        for img_path in files:
+    # Screenshot dates carry no year; resolve them all against this run's
+    # start time.
+    now = datetime.now()
+    ocr = partial(ocr_batch, cur_year=now.year, cur_month=now.month)
+
+    # pytesseract runs tesseract as a subprocess and tesserocr releases the
+    # GIL while recognising, so plain threads overlap the OCR without
+    # forking the app.  Tesseract threads internally too,
+    # hence half the cores; each worker takes one contiguous batch of files
+    # (see ocr_batch) and map keeps file order.  Parsed rows go through
+    # import_ocr_rows once at the end, from this thread only, so re-runs
+    # skip rows that are already in the DB.
+    workers = max(1, (os.cpu_count() or 1) // 2)
+    size = -(-len(files) // workers)
+    batches = [files[i:i + size] for i in range(0, len(files), size)]
+    records = []
+    with ThreadPoolExecutor(max_workers=len(batches)) as ex:
+        per_file = (rows for batch in ex.map(ocr, batches) for rows in batch)
+        for img_path, rows in zip(files, per_file):
             print(f"  OCR → {img_path.name}")
-            text = pytesseract.image_to_string(Image.open(img_path))
-
-            added = 0
-            for line in text.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Very permissive regex for Chase browser view
-                m = re.search(r'(\d{1,2}/\d{1,2})\s+(.+?)\s+(-?\$?[\d,]+\.\d{2})$', line)
-                if not m:
-                    m = re.search(r'(\d{1,2}/\d{1,2})\s+(.+?)\s+(-?[\d,]+\.\d{2})$', line)
-
-                if m:
-                    date_str, merchant, amt_str = m.groups()
-                    try:
-                        # Clean amount
-                        clean_amt = amt_str.replace('$', '').replace(',', '').replace('(', '-').replace(')', '')
-                        amount = float(clean_amt)
-                        if amount > 0:  # Chase shows expenses as positive
-                            amount = -amount
-
-                        # Parse date
-                        month, day = map(int, date_str.split('/'))
-                        year = datetime.now().year
-                        if month == 12 and datetime.now().month == 1:
-                            year -= 1
-                        tx_date = datetime(year, month, day).date()
-
-                        tx = Transaction(
-                            date=tx_date,
-                            amount=amount,
-                            merchant=merchant.strip(),
-                            source="Chase (screenshot)",
-                            category="Uncategorized"
-                        )
-                        db.session.add(tx)
-                        added += 1
-                    except:
-                        continue
-
-            if added > 0:
-                db.session.commit()
-                print(f"     +{added} transactions added")
-                total += added
+            if rows:
+                print(f"     +{len(rows)} transactions parsed")
             else:
                 print(f"     No transactions found in this image")
+            records.extend(rows)
+
+    with app.app_context():
+        inserted, skipped = import_ocr_rows(
+            records, default_source=_SCREENSHOT_SOURCE,
+            default_account=_SCREENSHOT_ACCOUNT,
+        )
 
-        print(f"\nSUCCESS — {total} transactions imported from screenshots!")
-        print(f"Total in database: {Transaction.query.count()}")
+    print(
+        f"\nSUCCESS — {inserted} transactions imported from screenshots "
+        f"({skipped} already present)!"
+    )
 
 if __name__ == "__main__":
     import_chase_screenshots()
@@ -0,0 +1,41 @@
+"""
+One-off migration: add the composite indexes declared on
+Transaction.__table_args__ — (date, amount) and the importer identity
+(date, amount, merchant, account_name, source_system) — to an existing
+database.
+
+db.create_all() only creates indexes together with new tables, so databases
+created before the index was added need this once.  Idempotent — safe to
+re-run.
+
+Run from the project root with the venv active:
+    python scripts/migrate_add_transaction_date_index.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+load_dotenv(dotenv_path=".env")
+
+from app import app
+from models import db, Transaction
+
+
+def add_index_if_missing():
+    from sqlalchemy import inspect
+
+    insp = inspect(db.engine)
+    existing = {ix["name"] for ix in insp.get_indexes(Transaction.__tablename__)}
+    for index in Transaction.__table__.indexes:
+        if index.name in existing:
+            print(f"Index {index.name} already exists — skipping")
+            continue
+        index.create(bind=db.engine)
+        print(f"Created index: {index.name}")
+
+
+with app.app_context():
+    add_index_if_missing()
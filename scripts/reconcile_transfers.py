@@ -12,6 +12,7 @@ This script:
 - Marks the "mirror" side as is_transfer=True and links both rows
 """
 
+import re
 from datetime import timedelta
 
 from sqlalchemy import inspect, text
@@ -35,19 +36,15 @@ def looks_like_venmo(merchant, desc=""):
     return "VENMO" in s
 
 
+# Transfer keywords as one alternation.  Longer phrases such as
+# "ONLINE TRANSFER" / "ACH TRANSFER" / "ONLINE XFER" are already covered by
+# TRANSFER and XFER, so they don't need their own branches.
+_TRANSFER_KEYWORDS_RE = re.compile(r"TRANSFER|XFER|ACH CREDIT|ACH DEBIT|ZELLE")
+
+
 def looks_like_transfer_description(merchant, desc=""):
     s = normalize_str(merchant) + " " + normalize_str(desc)
-    keywords = [
-        "TRANSFER",
-        "XFER",
-        "ONLINE TRANSFER",
-        "ONLINE XFER",
-        "ACH TRANSFER",
-        "ACH CREDIT",
-        "ACH DEBIT",
-        "ZELLE",
-    ]
-    return any(k in s for k in keywords)
+    return _TRANSFER_KEYWORDS_RE.search(s) is not None
 
 
 # --------- Classification helpers (work on Transaction objects) --------- #
@@ -321,3 +321,19 @@ def test_budget_summary_sga_has_visual(client):
 def test_budget_summary_uber_under_sga_limit(client):
     resp = client.get("/budget-summary")
     assert b"$330" in resp.data
+
+
+def test_cc_net_chart_buckets_card_activity_by_month(client, make_transaction):
+    from datetime import date
+
+    make_transaction(date=date(2025, 6, 3), amount=-40.00, merchant="Costco", account_id=7)
+    make_transaction(date=date(2025, 6, 20), amount=-5.25, merchant="INTEREST CHARGE", account_id=7)
+    make_transaction(date=date(2025, 6, 21), amount=-99.00, merchant="Checking", account_id=1)
+    make_transaction(date=date(2026, 4, 30), amount=-7.50, merchant="Last month", account_id=7)
+    make_transaction(date=date(2026, 5, 2), amount=-10.00, merchant="Out of window", account_id=7)
+
+    resp = client.get("/budget-summary")
+    # tojson escapes the apostrophe in "Jun '25".
+    assert b'{"interest": -5.25, "month": "Jun \\u002725", "net": -45.25}' in resp.data
+    assert b'{"interest": 0.0, "month": "May \\u002725", "net": 0.0}' in resp.data
+    assert b'{"interest": 0.0, "month": "Apr \\u002726", "net": -7.5}' in resp.data
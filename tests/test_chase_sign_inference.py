@@ -233,3 +233,22 @@ def test_closed_ledger_reconciliation(tmp_path):
         f"Closed-ledger mismatch: beg={BEG} + net={actual_net:.2f} "
         f"≠ end={END}  (expected net={EXPECTED_NET:.2f})"
     )
+
+
+# --- Payroll extra pass: lines outside the detail block are added once ----
+def test_payroll_outside_detail_block_is_deduplicated(tmp_path):
+    payroll = "Millennium Healt Direct Dep PPD ID: 9111111103"
+    ocr = _build_ocr(
+        "August 15, 2025 through September 15, 2025",
+        [f"08/15  {payroll}  1789.19  1889.19"],
+    )
+    ocr += (
+        f"08/15 {payroll} 1789.19 1889.19\n"
+        f"08/29 {payroll} 1789.19 3678.38\n"
+        f"08/29 {payroll} 1789.19 3678.38\n"
+    )
+    rows = _parse(tmp_path, ocr)
+    assert [(r["Date"], r["Amount"]) for r in rows] == [
+        ("2025-08-15", 1789.19),
+        ("2025-08-29", 1789.19),
+    ]
@@ -233,3 +233,21 @@ def test_api_summary_still_works(client):
     for key in ("current_balance", "net_this_month", "total_income_this_month",
                 "total_spent_this_month", "today", "by_category", "trend"):
         assert key in data
+
+
+def test_api_summary_totals_split_by_month_and_sign(client, make_transaction):
+    before = client.get("/api/summary").get_json()
+
+    today = date.today()
+    make_transaction(date=today, amount=100.00, category="Income")
+    make_transaction(date=today, amount=-30.00, category="Food")
+    make_transaction(date=date(today.year - 1, 1, 15), amount=-50.00)
+
+    data = client.get("/api/summary").get_json()
+    assert data["current_balance"] == pytest.approx(before["current_balance"] + 20.0)
+    assert data["total_income_this_month"] == pytest.approx(
+        before["total_income_this_month"] + 100.0)
+    assert data["total_spent_this_month"] == pytest.approx(
+        before["total_spent_this_month"] - 30.0)
+    assert data["net_this_month"] == pytest.approx(before["net_this_month"] + 70.0)
+    assert {"category": "Food", "amount": -30.0} in data["by_category"]
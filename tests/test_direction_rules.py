@@ -0,0 +1,151 @@
+"""
+Tests for direction_rules: hint-word scoring, sign inference and the
+lightweight transaction-type classifier.
+"""
+import pytest
+
+import direction_rules
+from direction_rules import (
+    CREDIT_HINT_WORDS,
+    DEBIT_HINT_WORDS,
+    score_direction_hints,
+)
+
+DESCRIPTIONS = [
+    "card purchase 01/19 walmart.com 800-925-6278 ar card 9241",
+    "millennium healt payroll ppd id: 9111111103",
+    "real time transfer recd from aba/contr bnk-021000021 from: venmo",
+    "zelle payment from jane doe 12345",
+    "paypal inst xfer paypal inst xfer netflix",
+    "atm withdrawal 01/02 atm withdrawal",
+    "cr adjustment interest paid",
+    "netflix.com los gatos ca",
+    "",
+]
+
+
+def _naive_scores(text):
+    return (
+        sum(1 for w in DEBIT_HINT_WORDS if w in text),
+        sum(1 for w in CREDIT_HINT_WORDS if w in text),
+    )
+
+
+@pytest.mark.parametrize("text", DESCRIPTIONS)
+def test_score_direction_hints_matches_substring_count(text):
+    """Scores equal a plain count of hint words occurring in the text."""
+    assert score_direction_hints(text) == _naive_scores(text)
+
+
+@pytest.mark.parametrize("text", DESCRIPTIONS)
+def test_score_direction_hints_fallback_without_automaton(text, monkeypatch):
+    """The substring fallback (no pyahocorasick) gives the same scores."""
+    monkeypatch.setattr(direction_rules, "_HINT_AUTOMATON", None)
+    score_direction_hints.cache_clear()
+    try:
+        assert score_direction_hints(text) == _naive_scores(text)
+    finally:
+        score_direction_hints.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # Inflected forms still hit the base hint word.
+        ("ebay compduytyu6 payments", (1, 0)),
+        ("amazon refunded", (0, 1)),
+        # Hints with edge spaces only match at those boundaries.
+        ("ach cr adjustment", (0, 2)),
+        ("acre farms", (0, 0)),
+    ],
+)
+def test_hint_words_match_as_substrings_not_tokens(text, expected):
+    assert score_direction_hints(text) == expected
+
+
+def test_direction_context_normalizes_once():
+    ctx = direction_rules.DirectionContext(description="  Direct   DEP  Payroll ")
+    assert ctx.normalized == "direct dep payroll"
+    assert ctx.balance_before is None and ctx.balance_after is None
+    assert not hasattr(ctx, "__dict__")
+
+
+def test_parse_signed_amount_uses_context_case_insensitively():
+    assert direction_rules.parse_signed_amount("12.50", "CARD PURCHASE Walmart") == -12.5
+    assert direction_rules.parse_signed_amount("12.50", "Direct Deposit  PAYROLL") == 12.5
+
+
+@pytest.mark.parametrize(
+    "description, expected",
+    [
+        ("MILLENNIUM HEALT PAYROLL PPD", "income"),
+        ("Card Purchase 01/19 payroll card", "income"),  # priority, not position
+        ("Monthly Service Charge", "fee"),
+        ("Amazon Refund", "refund"),
+        ("Zelle payment to Jane", "transfer"),
+        ("ATM Withdrawal", "expense"),
+        ("interest paid", "interest"),
+        ("NETFLIX.COM", "unknown"),
+    ],
+)
+def test_classify_transaction_type(description, expected):
+    assert direction_rules.classify_transaction_type(description) == expected
+
+
+@pytest.mark.parametrize(
+    "raw, context, expected",
+    [
+        ("-12.00", "direct deposit", -12.0),
+        ("+12.00", "card purchase", 12.0),
+        ("(1,234.50)", "card purchase", 1234.5),
+        ("(12.00", "card purchase", None),
+        ("  45.00 ", "payroll", 45.0),
+        ("45.00", "", -45.0),
+    ],
+)
+def test_parse_signed_amount_explicit_sign_and_context(raw, context, expected):
+    if expected is None:
+        with pytest.raises(ValueError):
+            direction_rules.parse_signed_amount(raw, context)
+    else:
+        assert direction_rules.parse_signed_amount(raw, context) == expected
+
+
+def test_parse_signed_amount_uses_balance_delta():
+    assert direction_rules.parse_signed_amount(
+        "10.00", "netflix", balance_before=100.0, balance_after=110.0
+    ) == 10.0
+
+
+def test_parse_signed_amount_rejects_empty():
+    with pytest.raises(ValueError):
+        direction_rules.parse_signed_amount(None)
+    with pytest.raises(ValueError):
+        direction_rules.parse_signed_amount("  ")
+
+
+@pytest.mark.parametrize(
+    "context, expected_sign",
+    [
+        # Both lists hit; the side with more hits must win, so scoring
+        # cannot stop at the first matching keyword.
+        ("payment received thank you", +1),
+        ("online transfer from savings", +1),
+        ("venmo payment received", +1),
+        ("card purchase refund", -1),
+    ],
+)
+def test_infer_direction_sign_counts_all_hits(context, expected_sign):
+    ctx = direction_rules.DirectionContext(description=context)
+    assert direction_rules.infer_direction_sign("10.00", ctx) == expected_sign
+
+
+@pytest.mark.parametrize(
+    "before, after, expected_sign",
+    [(100.0, 90.0, -1), (90.0, 100.0, +1), (50.0, 50.0, -1)],
+)
+def test_infer_direction_sign_from_balance_delta(before, after, expected_sign):
+    ctx = direction_rules.DirectionContext(
+        description="netflix", balance_before=before, balance_after=after
+    )
+    assert direction_rules.infer_direction_sign("10.00", ctx) == expected_sign
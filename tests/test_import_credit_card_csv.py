@@ -0,0 +1,91 @@
+"""
+Tests for scripts/import_credit_card_csv.py: parsing, direction modes,
+notes prefix and duplicate skipping, run end to end through main().
+"""
+import importlib.util
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from models import db, Transaction
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "import_credit_card_csv.py"
+
+CSV_TEXT = (
+    "Post Date,Merchant,Amount,Type,Memo,Unused\n"
+    "01/05/2025,Corner Cafe,12.50,PURCHASE,coffee,x\n"
+    "01/06/2025,Card Payment,\"1,000.00\",PAYMENT,,x\n"
+    "01/07/2025,Mystery Shop,-3.00,OTHER,odd,x\n"
+    "01/05/2025,Corner Cafe,12.50,PURCHASE,coffee,x\n"  # repeat in CSV
+    "01/08/2025,Book Shop,8.00,SALE,,x\n"               # already in DB
+    "not a date,Broken,5.00,SALE,,x\n"
+    "01/09/2025,Broken,abc,SALE,,x\n"
+)
+
+
+@pytest.fixture
+def cc_script():
+    spec = importlib.util.spec_from_file_location("import_credit_card_csv", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _cc_rows():
+    return (
+        Transaction.query.filter_by(source_system="CC Test")
+        .order_by(Transaction.date, Transaction.merchant)
+        .all()
+    )
+
+
+def test_main_imports_csv_rows(app, make_transaction, cc_script, tmp_path, monkeypatch, capsys):
+    csv_path = tmp_path / "card.csv"
+    csv_path.write_text(CSV_TEXT, encoding="utf-8-sig")
+    make_transaction(
+        date=date(2025, 1, 8),
+        amount=8.0,
+        merchant="Book Shop",
+        account_name="CC Acct",
+        source_system="CC Test",
+    )
+    monkeypatch.setattr(sys, "argv", [
+        "import_credit_card_csv.py",
+        "--csv", str(csv_path),
+        "--source", "CC Test",
+        "--account", "CC Acct",
+        "--date-col", "Post Date",
+        "--amount-col", "Amount",
+        "--merchant-col", "Merchant",
+        "--desc-col", "Merchant",
+        "--direction-mode", "column",
+        "--direction-col", "Type",
+        "--notes-col", "Memo",
+        "--prefix-notes", "[CC]",
+    ])
+
+    try:
+        cc_script.main()
+
+        rows = [
+            (t.date, t.merchant, t.amount, t.direction, t.notes)
+            for t in _cc_rows()
+            if t.merchant != "Book Shop"
+        ]
+        assert rows == [
+            (date(2025, 1, 5), "Corner Cafe", 12.5, "debit", "[CC] coffee"),
+            (date(2025, 1, 6), "Card Payment", 1000.0, "credit", "[CC]"),
+            # Unmapped type falls back to the amount sign.
+            (date(2025, 1, 7), "Mystery Shop", -3.0, "credit", "[CC] odd"),
+        ]
+        out = capsys.readouterr().out
+        assert "Total CSV rows seen:     7" in out
+        assert "Imported new rows:       3" in out
+        assert "Skipped existing rows:   2" in out
+        assert "Skipped invalid rows:    2" in out
+    finally:
+        for t in _cc_rows():
+            db.session.delete(t)
+        db.session.commit()
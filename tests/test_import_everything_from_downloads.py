@@ -0,0 +1,42 @@
+"""
+Tests for scripts/import_everything_from_downloads.py: the file_checksums
+ledger records stat keys for new and already-known files.
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from models import db, FileChecksum
+
+SCRIPT = (
+    Path(__file__).resolve().parent.parent / "scripts" / "import_everything_from_downloads.py"
+)
+
+
+@pytest.fixture
+def downloads_script():
+    spec = importlib.util.spec_from_file_location("import_everything_from_downloads", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_record_checksums_stores_stat_keys_for_known_files(app, downloads_script, tmp_path):
+    known, new = "a" * 64, "b" * 64
+    db.session.add(FileChecksum(sha256=known, filename="ledger name.pdf"))  # legacy row
+    db.session.commit()
+    mtime_ns = 1_700_000_000_123_456_789  # too big for a 32-bit INTEGER
+
+    try:
+        downloads_script.record_checksums(
+            {new: (Path("/dl/new.pdf"), ("new.pdf", 10, mtime_ns))},
+            {known: (Path("/dl/old.pdf"), ("old.pdf", 5, mtime_ns + 1))},
+        )
+
+        checksums, stat_keys = downloads_script.load_existing_checksums(tmp_path)
+        assert {known, new} <= checksums
+        assert {("new.pdf", 10, mtime_ns), ("old.pdf", 5, mtime_ns + 1)} <= stat_keys
+    finally:
+        FileChecksum.query.filter(FileChecksum.sha256.in_([known, new])).delete()
+        db.session.commit()
@@ -0,0 +1,69 @@
+"""
+Tests for scripts/import_screenshots_now.py: screenshot rows go through
+import_ocr_rows, so a re-run does not duplicate them.
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from models import db, Transaction
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "import_screenshots_now.py"
+
+OCR_TEXT = (
+    "Available balance $1,254.69\n"
+    "1/05 CORNER CAFE $12.50\n"
+    "1/06 PAYROLL DEPOSIT -$500.00\n"
+)
+
+
+@pytest.fixture
+def shot_script():
+    spec = importlib.util.spec_from_file_location("import_screenshots_now", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _shot_rows():
+    return (
+        Transaction.query.filter_by(source_system="Chase (screenshot)")
+        .order_by(Transaction.merchant)
+        .all()
+    )
+
+
+def test_import_chase_screenshots_is_idempotent(app, shot_script, tmp_path, monkeypatch):
+    shots = tmp_path / "uploads" / "screenshots"
+    shots.mkdir(parents=True)
+    (shots / "a.png").write_bytes(b"")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        shot_script, "ocr_batch",
+        lambda paths, cur_year, cur_month: [
+            shot_script.parse_screenshot_text(OCR_TEXT, cur_year, cur_month)
+            for _ in paths
+        ],
+    )
+
+    try:
+        shot_script.import_chase_screenshots()
+        shot_script.import_chase_screenshots()
+
+        rows = [
+            (t.merchant, t.amount, t.direction, t.account_name) for t in _shot_rows()
+        ]
+        assert rows == [
+            ("CORNER CAFE", -12.5, "debit", "Chase Checking"),
+            ("PAYROLL DEPOSIT", -500.0, "debit", "Chase Checking"),
+        ]
+    finally:
+        for t in _shot_rows():
+            db.session.delete(t)
+        db.session.commit()
+
+
+def test_parse_screenshot_text_rolls_december_back_in_january(shot_script):
+    rows = shot_script.parse_screenshot_text("12/30 CORNER CAFE $4.00", 2025, 1)
+    assert [r["Date"].isoformat() for r in rows] == ["2024-12-30"]
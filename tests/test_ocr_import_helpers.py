@@ -0,0 +1,73 @@
+"""
+Tests for import_ocr_rows: identity-key dedupe and the bulk insert.
+"""
+from datetime import date
+
+from models import db, Transaction
+from ocr_import_helpers import import_ocr_rows
+
+
+def _row(**overrides):
+    row = {
+        "Date": "2025-03-04",
+        "Amount": "-12.50",
+        "Merchant": "Corner Cafe",
+        "Source": "Helper Test",
+        "Account": "Helper Acct",
+        "Direction": "debit",
+    }
+    row.update(overrides)
+    return row
+
+
+def _helper_rows():
+    return Transaction.query.filter_by(source_system="Helper Test").all()
+
+
+def test_import_ocr_rows_skips_existing_and_in_batch_repeats(app, make_transaction):
+    make_transaction(
+        date=date(2025, 3, 4),
+        amount=-12.50,
+        merchant="Corner Cafe",
+        account_name="Helper Acct",
+        source_system="Helper Test",
+    )
+    try:
+        inserted, skipped = import_ocr_rows(
+            [
+                _row(),                                   # already in DB
+                _row(Merchant="Book Shop", Amount="-8"),  # new
+                _row(Merchant="Book Shop", Amount="-8"),  # repeat in batch
+                _row(Date=None),                          # undatable
+            ]
+        )
+        assert (inserted, skipped) == (1, 3)
+
+        new = [t for t in _helper_rows() if t.merchant == "Book Shop"]
+        assert len(new) == 1
+        assert new[0].amount == -8.0
+        assert new[0].is_transfer is False
+    finally:
+        for t in _helper_rows():
+            db.session.delete(t)
+        db.session.commit()
+
+
+def test_import_ocr_rows_ignores_matching_transfer_rows(app, make_transaction):
+    make_transaction(
+        date=date(2025, 3, 5),
+        amount=-40.0,
+        merchant="Savings",
+        account_name="Helper Acct",
+        source_system="Helper Test",
+        is_transfer=True,
+    )
+    try:
+        inserted, skipped = import_ocr_rows(
+            [_row(Date="2025-03-05", Amount="-40", Merchant="Savings")]
+        )
+        assert (inserted, skipped) == (1, 0)
+    finally:
+        for t in _helper_rows():
+            db.session.delete(t)
+        db.session.commit()
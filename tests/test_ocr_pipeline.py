@@ -166,3 +166,297 @@ def test_uploader_routes_to_chase_detail_parser(tmp_path, monkeypatch):
     )
     assert stats["statement_rows"] == 4
     assert stats["added_transactions"] == 4
+
+
+# ---------------------------------------------------------------------------
+# 3. OCR step
+#    PDFs/images are OCR'd as a batch after the upload scan; a file whose
+#    OCR fails is reported and dropped without affecting the others.
+# ---------------------------------------------------------------------------
+def test_uploader_drops_files_whose_ocr_fails(tmp_path, monkeypatch):
+    import ocr_pipeline
+
+    uploads_dir = tmp_path / "uploads"
+    statements_dir = tmp_path / "statements"
+    uploads_dir.mkdir()
+    statements_dir.mkdir()
+
+    (uploads_dir / "a_broken.pdf").write_bytes(b"%PDF-1.4 not really")
+    (uploads_dir / "chase_statement_detail.txt").write_text(FIXTURE.read_text())
+
+    def _fail(src, dst, passes=1):
+        raise RuntimeError("pdftotext failed")
+
+    monkeypatch.setattr(ocr_pipeline, "ocr_to_text_with_consistency", _fail)
+    monkeypatch.setattr(
+        ocr_pipeline,
+        "import_ocr_rows",
+        lambda rows, **kw: (len(rows), 0),
+    )
+
+    stats = ocr_pipeline.process_uploaded_statement_files(uploads_dir, statements_dir)
+
+    assert stats["saved_files"] == 1
+    assert stats["candidate_lines"] == 4
+    assert not (statements_dir / "a_broken_ocr.txt").exists()
+
+
+# ---------------------------------------------------------------------------
+# 4. Generic line normalizer
+#    First date-like token, last amount-like token, description in between.
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("01/15/2025 CARD PURCHASE  WALMART -45.67",
+         ("2025-01-15", "CARD PURCHASE WALMART", -45.67)),
+        # first date wins; the later one is part of the description
+        ("ref 2025-01-03 moved 01/04/25 12.00 bal 3,000.00 end",
+         ("2025-01-03", "moved 01/04/25 12.00 bal", 3000.0)),
+        # amount tokens must be whole tokens
+        ("01/15/2025 ITEM x5.00", None),
+        # amount before the date does not count
+        ("5.00 01/15/2025 NOTHING", None),
+        # nothing between date and amount
+        ("01/15/2025 5.00", None),
+    ],
+)
+def test_normalize_row_picks_first_date_and_last_amount(line, expected):
+    from ocr_pipeline import _normalize_row
+
+    row = _normalize_row(line, "Statement OCR", "x_ocr.txt")
+    if expected is None:
+        assert row is None
+    else:
+        date_str, desc, amount = expected
+        assert row["Date"] == date_str
+        assert row["Description"] == desc
+        assert abs(row["Amount"]) == pytest.approx(abs(amount))
+
+
+# ---------------------------------------------------------------------------
+# 5. Category guesser
+#    The first category (in rule order) with any keyword in the description
+#    wins, with or without the pyahocorasick automaton.
+# ---------------------------------------------------------------------------
+CATEGORY_CASES = [
+    ("card purchase walmart.com", "Groceries"),
+    ("TARGET.COM order", "Groceries"),         # "TARGET" outranks Shopping
+    ("payroll transfer", "Income"),            # Income before Transfers
+    ("shell oil 123 refund", "Transportation"),
+    ("zelle to jane", "Transfers"),
+    ("corner bookshop", "Uncategorized"),
+    ("", "Uncategorized"),
+]
+
+
+@pytest.mark.parametrize("description, expected", CATEGORY_CASES)
+def test_guess_category_rule_priority(description, expected):
+    from ocr_pipeline import _guess_category
+
+    assert _guess_category(description) == expected
+
+
+@pytest.mark.parametrize("description, expected", CATEGORY_CASES)
+def test_guess_category_without_automaton(description, expected, monkeypatch):
+    import ocr_pipeline
+
+    monkeypatch.setattr(ocr_pipeline, "_CATEGORY_AUTOMATON", None)
+    assert ocr_pipeline._guess_category(description) == expected
+
+
+def test_importing_pipeline_leaves_open_and_path_rename_alone():
+    import builtins
+    import io
+    import pathlib
+
+    import ocr_pipeline  # noqa: F401
+
+    assert builtins.open is io.open
+    assert pathlib.Path.rename.__module__ == "pathlib"
+
+
+def test_process_statement_files_merges_files_in_order(tmp_path):
+    import ocr_pipeline
+
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"s{i}_ocr.txt"
+        p.write_text(
+            f"01/0{i + 1}/2025 CARD PURCHASE SHOP{i} -1{i}.00\n"
+            "TOTAL FEES 9.99\n"
+        )
+        paths.append(str(p))
+
+    rows, rejected = ocr_pipeline.process_statement_files(paths, collect_rejected=True)
+    serial = [ocr_pipeline._parse_ocr_text_file(p, "Statement OCR") for p in paths]
+
+    assert rows == [row for file_rows in serial for row in file_rows]
+    assert [r["Date"] for r in rows] == ["2025-01-01", "2025-01-02", "2025-01-03"]
+    assert len(rejected) == 3
+
+
+def test_process_statement_files_accepts_any_iterable(tmp_path, monkeypatch):
+    import ocr_pipeline
+
+    # Force the pool path so both branches see a generator.
+    monkeypatch.setattr(ocr_pipeline, "_STATEMENT_POOL_MIN_FILES", 2)
+    p = tmp_path / "s_ocr.txt"
+    p.write_text("01/02/2025 CARD PURCHASE SHOP -12.00\n")
+
+    for n in (1, 2):
+        rows = ocr_pipeline.process_statement_files(str(p) for _ in range(n))
+        assert [r["Amount"] for r in rows] == [-12.0] * n
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("CARD 1234 PURCHASE", ""),
+        ("ONLINE PAYMENT ACCT 5072", "Acct *5072"),
+        # priority order, not position
+        ("XFER 5072 TO 0205", "Acct *0205"),
+        # substring match, overlapping hits included
+        ("REF 938383", "Acct *3838"),
+    ],
+)
+def test_detect_account_from_known_suffix(line, expected):
+    import ocr_pipeline
+
+    _, account = ocr_pipeline._detect_source_and_account(line, "stmt_ocr.txt", "Statement OCR")
+    assert account == expected
+
+
+def test_capone_0728_dates_follow_statement_period(tmp_path):
+    import ocr_pipeline
+
+    p = tmp_path / "capone_ocr.txt"
+    p.write_text(
+        "Platinum Card | Platinum Mastercard ending in 0728\n"
+        "Dec 10, 2024 - Jan 09, 2025\n"
+        "JANE DOE #0728: Payments, Credits and Adjustments\n"
+        "Trans Date Post Date Description Amount\n"
+        "Jan 3   Jan 3   CAPITAL ONE MOBILE PYMT   - $25.00\n"
+        "JANE DOE #0728: Transactions\n"
+        "Dec 28  Dec 29  NETFLIX.COM LOS GATOS CA   $15.49\n"
+        "Jan 2   Jan 3   SHELL OIL 1234             $40.00\n"
+        "Total Transactions for This Period $55.49\n"
+    )
+
+    rows = ocr_pipeline._parse_capone_0728_statement(p)
+
+    assert [(r["Date"], r["Amount"], r["Direction"]) for r in rows] == [
+        ("2025-01-03", 25.0, "credit"),
+        ("2024-12-28", -15.49, "debit"),
+        ("2025-01-02", -40.0, "debit"),
+    ]
+
+
+def test_iter_capone_csv_rows_signs_and_defaults(tmp_path):
+    import datetime
+    from decimal import Decimal
+
+    import ocr_pipeline
+
+    (tmp_path / "capone").mkdir()
+    (tmp_path / "capone" / "a.csv").write_text(
+        "Transaction Date,Posted Date,Card No.,Description,Category,Debit,Credit\n"
+        "2024-12-28,2024-12-29,0728,NETFLIX.COM,Entertainment,15.49,\n"
+        '2025-01-03,2025-01-03,0728,CAPITAL ONE MOBILE PYMT,Payment,,"$1,025.00"\n'
+        ",,,,,,\n"
+    )
+    (tmp_path / "capone" / "b.csv").write_text("")  # empty export is skipped
+
+    rows = list(ocr_pipeline.iter_capone_csv_rows(tmp_path, chunksize=2))
+
+    assert [(r["date"], r["amount"], r["account_name"]) for r in rows] == [
+        (datetime.date(2024, 12, 28), Decimal("-15.49"), "Capital One 0728"),
+        (datetime.date(2025, 1, 3), Decimal("1025.00"), "Capital One 0728"),
+        (None, Decimal("0.00"), "Capital One Unknown"),
+    ]
+    assert all(type(r["amount"]) is Decimal for r in rows)
+    assert rows[2]["merchant"] == "Capital One transaction"
+    assert rows[0]["raw_desc"] == "a.csv | 2024-12-28 | NETFLIX.COM | 0728 | Entertainment"
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("Payments -$29.00", "payments"),
+        ("Purchases and Other Debits $49.03", "purchases"),
+        ("Total Fees Charged This Period $31.00", "fees"),
+        ("Total Interest Charged This Period $2.10", "interest"),
+        # priority, not position
+        ("Fees and Payments", "payments"),
+        ("04/15 8521 PAYPAL PURCHASE $30.77", None),
+    ],
+)
+def test_paypal_section_for_line(line, expected):
+    import ocr_pipeline
+
+    assert ocr_pipeline._paypal_section_for_line(line) == expected
+
+
+def test_parse_paypal_credit_detail_sections_and_continuations(tmp_path):
+    import ocr_pipeline
+
+    p = tmp_path / "paypal_ocr.txt"
+    p.write_text(
+        "PayPal Credit  Account Number ending in 1234\n"
+        "Payment due date 05/10/2025\n"
+        "Transaction details\n"
+        "Date Reference # Description           Amount\n"
+        "Payments -$29.00\n"
+        "04/15 8521 PAYMENT - THANK YOU -$29.00\n"
+        "Purchases and Other Debits $30.77\n"
+        "03/30 8533 PAYPAL PURCHASE $30.77\n"
+        "ALIPAYUSINC\n"
+        "Total Fees Charged This Period $29.00\n"
+        "04/12 LATE FEE $29.00\n"
+        "Cardholder news and information\n"
+        "04/20 9999 IGNORED ROW $1.00\n"
+    )
+
+    rows = ocr_pipeline._parse_paypal_credit_detail(p)
+
+    assert [
+        (r["Date"], r["Amount"], r["Direction"], r["Description"], r["Category"])
+        for r in rows
+    ] == [
+        ("2025-04-15", 29.0, "transfer", "PAYMENT - THANK YOU", "Transfer:Card Payment"),
+        ("2025-03-30", -30.77, "debit", "PAYPAL PURCHASE ALIPAYUSINC", "Spending:Purchases"),
+        ("2025-04-12", -29.0, "debit", "FEE", "Fees:Card Fees"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["NETFLIX.COM LOS GATOS", "SHELL  OIL", " EDGE ", "TAB\tSEP", "NBSP\xa0SEP", ""],
+)
+def test_collapse_ws_matches_split_join(text):
+    import ocr_pipeline
+
+    assert ocr_pipeline._collapse_ws(text) == " ".join(text.split())
+
+
+def test_count_candidates_only_inside_closed_detail_blocks(tmp_path):
+    import ocr_pipeline
+
+    p = tmp_path / "stmt_ocr.txt"
+    p.write_text(
+        "01/02 Outside Any Block 5.00 100.00\n"
+        "*start*transaction detail\n"
+        "01/03 Unterminated Block Row 1.00 99.00\n"
+        "*start*transaction detail\n"
+        "            Beginning Balance            100.00  100.00\n"
+        "01/05 Card Purchase Shell -40.00 60.00\n"
+        "01/06 Payroll Deposit 500.00 560.00\n"
+        "      Total Deposits 500.00 560.00\n"
+        "*end*transaction detail\n"
+        "*start*transaction detail\n"
+        "01/07 Second Block Row -1.00 559.00\n"
+        "*end*transaction detail\n"
+    )
+
+    assert ocr_pipeline._count_candidates_in_file(p) == 3
+
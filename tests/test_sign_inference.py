@@ -96,3 +96,22 @@ def test_sign_ach_payroll_credit():
         context="Millennium Healt Payroll PPD ID: 9111111103",
     )
     assert float(result) > 0, f"Expected positive, got {result}"
+
+
+@pytest.mark.parametrize(
+    "raw, context",
+    [
+        ("1,835.43", "Millennium Healt Payroll PPD ID: 9111111103"),
+        ("-1,300.00", "Online Transfer To Sav"),
+        ("(68.02)", ""),
+        ("68.02-", "refund"),
+        ("$12.00", "card purchase"),
+        ("−45.10", ""),
+        ("", "payroll"),
+        ("n/a", ""),
+    ],
+)
+def test_parse_signed_float_matches_decimal_version(raw, context):
+    """The float fast path applies exactly the same sign rules."""
+    from ocr_pipeline import parse_signed_amount, parse_signed_float
+    assert parse_signed_float(raw, context) == float(parse_signed_amount(raw, context))
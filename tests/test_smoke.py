@@ -143,3 +143,21 @@ def test_update_transaction_category_learning_error_is_handled(client, app, monk
     body = resp.get_json()
     assert body["status"] == "ok"
     assert body["transaction"]["category"] == "Dining"
+
+
+# ---------------------------------------------------------------------------
+# /import/ocr upload cleanup helper
+# ---------------------------------------------------------------------------
+
+def test_unlink_files_only_removes_matching_files(tmp_path):
+    from app import _unlink_files
+
+    (tmp_path / "a_ocr.txt").write_text("x")
+    (tmp_path / "keep.png").write_text("x")
+    (tmp_path / "sub.txt").mkdir()
+
+    _unlink_files(tmp_path, suffix=".txt")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["keep.png", "sub.txt"]
+
+    _unlink_files(tmp_path)
+    assert [p.name for p in tmp_path.iterdir()] == ["sub.txt"]